@@ -4,7 +4,8 @@ This module provides a simple, high-level interface for fetching and
 exploring market data. Designed for use in Jupyter notebooks and scripts.
 """
 
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
@@ -18,6 +19,9 @@ from src.utils.config import load_config
 
 logger = get_logger(__name__)
 
+# Cap on concurrent provider requests in get_multiple_symbols
+_MAX_FETCH_WORKERS = 16
+
 
 class DataAPI:
     """High-level API for market data access.
@@ -66,6 +70,10 @@ class DataAPI:
         config_path = root_dir / "config" / "default.yaml"
         self.config = load_config(str(config_path))
 
+        # info() windows keyed by symbol and tagged with the day they were loaded,
+        # so each symbol holds at most one entry and repeat calls skip the DB
+        self._info_cache: dict[str, tuple[date, pd.DataFrame]] = {}
+
         logger.debug("DataAPI initialized with %s and DB at %s", type(self.provider).__name__, db_path)
 
     def _parse_date(self, date_input: str | datetime) -> datetime:
@@ -91,6 +99,8 @@ class DataAPI:
             if chunk.index.tz is not None:
                 chunk.index = chunk.index.tz_localize(None)
             self.db.save_bars(chunk, symbol)
+            # New bars make any cached info() window for this symbol stale
+            self._info_cache.pop(symbol, None)
         return chunk
 
     def _fetch_gap_with_trading_calendar(
@@ -243,6 +253,9 @@ class DataAPI:
     ) -> dict[str, pd.DataFrame]:
         """Fetch data for multiple symbols.
 
+        Provider requests are I/O-bound, so symbols are fetched concurrently
+        on a small thread pool. Symbols that fail are logged and left out.
+
         Args:
             symbols: List of ticker symbols
             start: Start date
@@ -262,20 +275,29 @@ class DataAPI:
             ...     print(f"{symbol}: {len(df)} bars")
         """
         # Convert string dates to datetime if needed
-        if isinstance(start, str):
-            start = datetime.fromisoformat(start)
-        if isinstance(end, str):
-            end = datetime.fromisoformat(end)
+        start = self._parse_date(start)
+        end = self._parse_date(end)
 
         logger.info("Fetching data for %s symbols", len(symbols))
 
-        result = {}
-        for symbol in symbols:
-            try:
-                result[symbol] = self.provider.get_historical_bars(symbol, start, end)
-            except Exception as e:
-                logger.warning("Failed to fetch %s: %s", symbol, e)
-                # Continue with other symbols
+        result: dict[str, pd.DataFrame] = {}
+        if not symbols:
+            return result
+
+        workers = min(len(symbols), _MAX_FETCH_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                symbol: pool.submit(
+                    self.provider.get_historical_bars, symbol, start, end
+                )
+                for symbol in symbols
+            }
+            for symbol, future in futures.items():
+                try:
+                    result[symbol] = future.result()
+                except Exception as e:
+                    logger.warning("Failed to fetch %s: %s", symbol, e)
+                    # Continue with other symbols
 
         return result
 
@@ -309,13 +331,36 @@ class DataAPI:
             except Exception as e:
                 logger.error("Error updating %s: %s", symbol, e)
 
+    def _info_data(self, symbol: str) -> pd.DataFrame:
+        """Return the 30-day window used by info(), cached for the current day.
+
+        Empty results are not cached, and entries from earlier days are
+        replaced rather than kept alongside today's.
+        """
+        today = datetime.now().date()
+        cached = self._info_cache.get(symbol)
+        if cached is not None and cached[0] == today:
+            return cached[1]
+
+        data = self.get_latest(symbol, days=30)
+        if not data.empty:
+            self._info_cache[symbol] = (today, data)
+        return data
+
     def info(self, symbol: str) -> None:
-        """Print summary information about available data for a symbol.
+        """Log summary information about available data for a symbol.
+
+        Output goes through the module logger at INFO level; call
+        ``setup_logging()`` to see it in notebooks and scripts. The data
+        behind the summary is cached per symbol for the rest of the day,
+        until new bars for that symbol are saved.
 
         Args:
             symbol: Stock ticker symbol
 
         Example:
+            >>> from src.utils.logging import setup_logging
+            >>> setup_logging()
             >>> api = DataAPI()
             >>> api.info("AAPL")
             Symbol: AAPL
@@ -324,13 +369,13 @@ class DataAPI:
             ...
         """
         try:
-            data = self.get_latest(symbol, days=30)
-            print(f"Symbol: {symbol}")
-            print(f"Latest 30 days: {len(data)} trading days")
-            print(f"Date range: {data.index[0].date()} to {data.index[-1].date()}")
-            print(f"\nLatest close: ${data['close'].iloc[-1]:.2f}")
-            print(f"30-day high: ${data['high'].max():.2f}")
-            print(f"30-day low: ${data['low'].min():.2f}")
-            print(f"Average volume: {data['volume'].mean():,.0f}")
+            data = self._info_data(symbol)
+            logger.info("Symbol: %s", symbol)
+            logger.info("Latest 30 days: %d trading days", len(data))
+            logger.info("Date range: %s to %s", data.index[0].date(), data.index[-1].date())
+            logger.info("Latest close: $%.2f", data["close"].iloc[-1])
+            logger.info("30-day high: $%.2f", data["high"].max())
+            logger.info("30-day low: $%.2f", data["low"].min())
+            logger.info("Average volume: %s", format(data["volume"].mean(), ",.0f"))
         except Exception as e:
-            print(f"Error fetching info for {symbol}: {e}")
+            logger.error("Error fetching info for %s: %s", symbol, e)
@@ -5,10 +5,12 @@ with the SQLite database, including connection management, table creation,
 and data persistence.
 """
 
+import os
 import sqlite3
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional, List
+from typing import Iterator, Optional, List
 import threading
 
 import pandas as pd
@@ -18,6 +20,14 @@ from src.utils.exceptions import DataError
 
 logger = get_logger(__name__)
 
+# Throughput-over-durability settings for throwaway (test/in-memory) databases
+_FAST_PRAGMAS = """
+    PRAGMA journal_mode=MEMORY;
+    PRAGMA synchronous=OFF;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-65536;
+"""
+
 
 class DatabaseManager:
     """Manages SQLite database interactions.
@@ -26,6 +36,26 @@ class DatabaseManager:
         db_path: Path to the SQLite database file.
     """
 
+    # Column order matching the market_data INSERT placeholders
+    _BAR_COLUMNS = [
+        "symbol",
+        "date",
+        "open",
+        "high",
+        "low",
+        "close",
+        "volume",
+        "updated_at",
+    ]
+
+    # Constant SQL text so sqlite3's statement cache reuses the prepared query
+    _LOAD_BARS_SQL = """
+        SELECT date, open, high, low, close, volume
+        FROM market_data
+        WHERE symbol = ? AND date >= ? AND date <= ?
+        ORDER BY date ASC
+    """
+
     def __init__(self, db_path: str):
         """Initialize database manager.
 
@@ -33,6 +63,8 @@ class DatabaseManager:
             db_path: Path to the SQLite database file.
         """
         self.db_path = db_path
+        # Skip fsyncs for databases nobody needs to survive a crash
+        self._fast_io = db_path == ":memory:" or os.getenv("AITRADER_TEST_DB") == "1"
         # Ensure directory exists
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
         self._local = threading.local()
@@ -48,8 +80,44 @@ class DatabaseManager:
             # Enable row factory for name-based access if needed,
             # though we mostly use pandas read_sql
             self._local.connection.row_factory = sqlite3.Row
+            if self._fast_io:
+                self._local.connection.executescript(_FAST_PRAGMAS)
         return self._local.connection
 
+    @contextmanager
+    def bulk_writer(self) -> Iterator[None]:
+        """Group several save calls into a single transaction.
+
+        Writes made inside the block are committed once on exit (or rolled
+        back if the block raises) instead of once per save call.
+
+        Example:
+            >>> with db.bulk_writer():
+            ...     db.save_bars(first_chunk, "AAPL")
+            ...     db.save_bars(second_chunk, "AAPL")
+        """
+        if getattr(self._local, "in_bulk", False):
+            # Already inside an outer bulk transaction
+            yield
+            return
+
+        conn = self._get_connection()
+        self._local.in_bulk = True
+        try:
+            with conn:
+                yield
+        finally:
+            self._local.in_bulk = False
+
+    def _write_many(self, sql: str, records: list) -> None:
+        """Execute a batched write, committing unless inside bulk_writer()."""
+        conn = self._get_connection()
+        if getattr(self._local, "in_bulk", False):
+            conn.executemany(sql, records)
+        else:
+            with conn:
+                conn.executemany(sql, records)
+
     def create_tables(self) -> None:
         """Create necessary database tables if they don't exist."""
         schema_path = Path(__file__).parent / "schema.sql"
@@ -91,12 +159,10 @@ class DatabaseManager:
         if pd.api.types.is_datetime64_any_dtype(data["date"]):
             data["date"] = data["date"].dt.strftime("%Y-%m-%d")
 
-        records = data.to_dict("records")
-
         insert_sql = """
             INSERT INTO market_data
             (symbol, date, open, high, low, close, volume, updated_at)
-            VALUES (:symbol, :date, :open, :high, :low, :close, :volume, :updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
             ON CONFLICT(symbol, date) DO UPDATE SET
             open=excluded.open,
             high=excluded.high,
@@ -106,10 +172,10 @@ class DatabaseManager:
             updated_at=excluded.updated_at
         """
 
-        conn = self._get_connection()
         try:
-            with conn:
-                conn.executemany(insert_sql, records)
+            # Plain tuples bound positionally (cheaper to build than per-row dicts)
+            records = list(data[self._BAR_COLUMNS].itertuples(index=False, name=None))
+            self._write_many(insert_sql, records)
             logger.info(f"Saved {len(records)} bars for {symbol}")
         except Exception as e:
             logger.error(f"Failed to save bars for {symbol}: {e}")
@@ -131,13 +197,6 @@ class DatabaseManager:
         Returns:
             DataFrame with OHLCV data and datetime index "date".
         """
-        query = """
-            SELECT date, open, high, low, close, volume
-            FROM market_data
-            WHERE symbol = ? AND date >= ? AND date <= ?
-            ORDER BY date ASC
-        """
-
         # Format dates as strings for comparison
         start_str = start_date.strftime("%Y-%m-%d")
         end_str = end_date.strftime("%Y-%m-%d")
@@ -145,7 +204,7 @@ class DatabaseManager:
         conn = self._get_connection()
         try:
             df = pd.read_sql_query(
-                query,
+                self._LOAD_BARS_SQL,
                 conn,
                 params=(symbol, start_str, end_str),
                 parse_dates=["date"]
@@ -235,10 +294,8 @@ class DatabaseManager:
             created_at=excluded.created_at
         """
 
-        conn = self._get_connection()
         try:
-            with conn:
-                conn.executemany(insert_sql, records)
+            self._write_many(insert_sql, records)
             logger.info(
                 f"Saved universe '{name}' with {len(records)} symbols for {date_str}"
             )
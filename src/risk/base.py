@@ -52,7 +52,7 @@ class RiskCheckResult:
     timestamp: datetime = field(default_factory=datetime.now)
 
 
-@dataclass
+@dataclass(slots=True)
 class PositionRisk:
     """Risk metrics for a single position.
 
@@ -8,7 +8,10 @@ This module implements dynamic risk management for paper trading, combining:
 Core Philosophy: "Validate before trade, monitor during trade, protect always."
 """
 
-from typing import Dict, List, Optional
+import copy
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 from src.execution.base import Position
 from src.risk.base import (
@@ -115,6 +118,11 @@ class DynamicRiskManager(RiskManager):
         self.daily_loss_limit = daily_loss_limit
         self.max_drawdown = max_drawdown
 
+        # Bumped by every mutator; read-only reports are memoized against it
+        self._version = 0
+        self._metrics_cache: Optional[Tuple[int, Dict[str, float]]] = None
+        self._summary_cache: Optional[Tuple[int, Dict]] = None
+
     @classmethod
     def from_config(cls, config: Dict) -> "DynamicRiskManager":
         """Create DynamicRiskManager from configuration dict.
@@ -212,6 +220,23 @@ class DynamicRiskManager(RiskManager):
             shares: Number of shares
         """
         self._position_monitor.add_position(symbol, entry_price, shares)
+        self._version += 1
+
+    def start_positions(
+        self,
+        symbols: Sequence[str],
+        entry_prices: Sequence[float],
+        shares: Sequence[int],
+    ) -> None:
+        """Start tracking several positions in one call.
+
+        Args:
+            symbols: Ticker symbols
+            entry_prices: Entry price per symbol (list or NumPy array)
+            shares: Share count per symbol (list or NumPy array)
+        """
+        self._position_monitor.add_positions(symbols, entry_prices, shares)
+        self._version += 1
 
     def close_position(self, symbol: str) -> None:
         """Stop tracking a position (after it's closed).
@@ -220,6 +245,7 @@ class DynamicRiskManager(RiskManager):
             symbol: Ticker symbol
         """
         self._position_monitor.remove_position(symbol)
+        self._version += 1
 
     def update_prices(self, prices: Dict[str, float]) -> None:
         """Update current prices for all tracked positions.
@@ -230,6 +256,7 @@ class DynamicRiskManager(RiskManager):
             prices: Dict mapping symbol -> current price
         """
         self._position_monitor.update_prices(prices)
+        self._version += 1
 
     def check_all_positions(self) -> List[ExitSignal]:
         """Check all tracked positions for risk triggers.
@@ -258,6 +285,7 @@ class DynamicRiskManager(RiskManager):
             new_value: Current portfolio value
         """
         self._portfolio_monitor.update_value(new_value)
+        self._version += 1
 
     def reset_daily_tracking(self) -> None:
         """Reset daily tracking metrics.
@@ -265,6 +293,7 @@ class DynamicRiskManager(RiskManager):
         Call this at market open each day.
         """
         self._portfolio_monitor.reset_daily_start()
+        self._version += 1
 
     def check_circuit_breaker(self) -> bool:
         """Check if portfolio-level circuit breaker should trigger.
@@ -274,8 +303,24 @@ class DynamicRiskManager(RiskManager):
         Returns:
             True if circuit breaker triggered (halt trading)
         """
+        # May latch the breaker, which changes the summary
+        self._version += 1
         return self._portfolio_monitor.check_circuit_breaker()
 
+    def replay_portfolio_values(self, values: Sequence[float]) -> np.ndarray:
+        """Evaluate the circuit breaker over a historical value series.
+
+        Useful for replaying a day (or a backtest) without stepping through
+        update_portfolio_value() per tick. Does not change monitor state.
+
+        Args:
+            values: Portfolio values in time order
+
+        Returns:
+            Boolean array, True where the circuit breaker would trigger
+        """
+        return self._portfolio_monitor.replay_values(values)
+
     def get_circuit_breaker_reason(self) -> Optional[str]:
         """Get reason for circuit breaker trigger.
 
@@ -295,10 +340,61 @@ class DynamicRiskManager(RiskManager):
     def get_portfolio_metrics(self) -> Dict[str, float]:
         """Get current portfolio risk metrics.
 
+        The metrics are cached until the next state change; each call
+        returns its own copy.
+
         Returns:
             Dict with portfolio value, P&L, drawdown, etc.
         """
-        return self._portfolio_monitor.get_metrics()
+        cache = self._metrics_cache
+        if cache is None or cache[0] != self._version:
+            cache = self._metrics_cache = (
+                self._version,
+                self._portfolio_monitor.get_metrics(),
+            )
+        return dict(cache[1])
+
+    # ========================================================================
+    # State Snapshots
+    # ========================================================================
+
+    def snapshot(self) -> Tuple[Any, ...]:
+        """Capture the mutable monitoring state for a later restore().
+
+        Copies tracked positions and portfolio state; thresholds are not
+        included since they are fixed at construction.
+
+        Returns:
+            Opaque snapshot to pass to restore()
+        """
+        portfolio = self._portfolio_monitor
+        return (
+            {
+                symbol: copy.copy(state)
+                for symbol, state in self._position_monitor.positions.items()
+            },
+            copy.copy(portfolio.state),
+            portfolio.circuit_breaker_triggered,
+            portfolio.circuit_breaker_reason,
+        )
+
+    def restore(self, snapshot: Tuple[Any, ...]) -> None:
+        """Roll monitoring state back to a snapshot() result.
+
+        The snapshot is copied again, so it can be restored repeatedly.
+
+        Args:
+            snapshot: Value previously returned by snapshot()
+        """
+        positions, portfolio_state, triggered, reason = snapshot
+        self._position_monitor.positions = {
+            symbol: copy.copy(state) for symbol, state in positions.items()
+        }
+        portfolio = self._portfolio_monitor
+        portfolio.state = copy.copy(portfolio_state)
+        portfolio.circuit_breaker_triggered = triggered
+        portfolio.circuit_breaker_reason = reason
+        self._version += 1
 
     # ========================================================================
     # Batch Position Sync (for integration with Alpaca)
@@ -313,23 +409,24 @@ class DynamicRiskManager(RiskManager):
         Args:
             positions: Current positions from executor
         """
-        # Get current tracked symbols
-        tracked_symbols = set(self._position_monitor.positions.keys())
-        actual_symbols = {pos.symbol for pos in positions}
+        # Set differences keep reconciliation O(N + M) in tracked/held counts
+        tracked_symbols = set(self._position_monitor.positions)
+        by_symbol = {pos.symbol: pos for pos in positions}
 
         # Remove positions that are no longer held
-        for symbol in tracked_symbols - actual_symbols:
+        for symbol in tracked_symbols - by_symbol.keys():
             self.close_position(symbol)
 
-        # Add new positions (if not already tracked)
-        for position in positions:
-            if position.symbol not in tracked_symbols:
-                # Use avg_cost as entry price
-                self.start_position(
-                    symbol=position.symbol,
-                    entry_price=position.avg_cost,
-                    shares=position.shares,
-                )
+        # Add new positions (if not already tracked), keeping broker order
+        for symbol, position in by_symbol.items():
+            if symbol in tracked_symbols:
+                continue
+            # Use avg_cost as entry price
+            self.start_position(
+                symbol=symbol,
+                entry_price=position.avg_cost,
+                shares=position.shares,
+            )
 
     def validate_orders(
         self,
@@ -361,14 +458,19 @@ class DynamicRiskManager(RiskManager):
     def get_summary(self) -> Dict:
         """Get comprehensive risk summary.
 
+        Cached like get_portfolio_metrics(); each call returns its own copy.
+
         Returns:
             Dict with position count, portfolio metrics, and circuit breaker status
         """
-        position_risks = self.get_position_risks()
+        cache = self._summary_cache
+        if cache is not None and cache[0] == self._version:
+            return self._copy_summary(cache[1])
+
         portfolio_metrics = self.get_portfolio_metrics()
 
-        return {
-            "positions_tracked": len(position_risks),
+        summary = {
+            "positions_tracked": len(self._position_monitor.positions),
             "portfolio_value": portfolio_metrics["portfolio_value"],
             "daily_pnl_pct": portfolio_metrics["daily_pnl_pct"],
             "drawdown_from_peak": portfolio_metrics["drawdown_from_peak"],
@@ -381,3 +483,12 @@ class DynamicRiskManager(RiskManager):
                 "max_drawdown": self.max_drawdown,
             },
         }
+        self._summary_cache = (self._version, summary)
+        return self._copy_summary(summary)
+
+    @staticmethod
+    def _copy_summary(summary: Dict) -> Dict:
+        """Copy a cached summary, including its nested thresholds dict."""
+        copied = dict(summary)
+        copied["thresholds"] = dict(summary["thresholds"])
+        return copied
@@ -9,7 +9,9 @@ Core Philosophy: "Monitor continuously, act on thresholds."
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
 
 from src.execution.base import Position
 from src.risk.base import ExitSignal, PositionRisk
@@ -147,6 +149,33 @@ class PositionMonitor:
             shares=shares,
         )
 
+    def add_positions(
+        self,
+        symbols: Sequence[str],
+        entry_prices: Sequence[float],
+        shares: Sequence[int],
+        entry_time: Optional[datetime] = None,
+    ) -> None:
+        """Start tracking several positions opened at the same time.
+
+        Args:
+            symbols: Ticker symbols
+            entry_prices: Entry price per symbol (same order as symbols)
+            shares: Share count per symbol (same order as symbols)
+            entry_time: When positions were opened (default: now)
+
+        Raises:
+            ValueError: If the three sequences differ in length
+        """
+        if not len(symbols) == len(entry_prices) == len(shares):
+            raise ValueError("symbols, entry_prices and shares must have equal length")
+
+        if entry_time is None:
+            entry_time = datetime.now()
+
+        for symbol, price, qty in zip(symbols, entry_prices, shares):
+            self.add_position(symbol, float(price), int(qty), entry_time=entry_time)
+
     def remove_position(self, symbol: str) -> None:
         """Stop tracking a position (after it's closed).
 
@@ -222,12 +251,53 @@ class PositionMonitor:
     def check_all_positions(self) -> List[ExitSignal]:
         """Check all tracked positions for risk triggers.
 
+        Thresholds are screened for all positions at once with NumPy; only
+        positions that breach one are turned into ExitSignals.
+
         Returns:
             List of ExitSignal for positions that breached thresholds
         """
+        if not self.positions:
+            return []
+
+        symbols = list(self.positions.keys())
+        states = [self.positions[symbol] for symbol in symbols]
+        entry = np.fromiter(
+            (s.entry_price for s in states),
+            dtype=np.float64,
+            count=len(states),
+        )
+        current = np.fromiter(
+            (s.current_price for s in states),
+            dtype=np.float64,
+            count=len(states),
+        )
+        peak = np.fromiter(
+            (s.peak_price for s in states),
+            dtype=np.float64,
+            count=len(states),
+        )
+
+        # Same formulas (and zero guards) as PositionState.to_position_risk
+        pnl_pct = np.divide(
+            current - entry,
+            entry,
+            out=np.zeros_like(entry),
+            where=entry > 0,
+        )
+        breached = (pnl_pct <= -self.stop_loss_pct) | (pnl_pct >= self.take_profit_pct)
+        if self.trailing_stop_pct is not None:
+            drawdown = np.divide(
+                current - peak,
+                peak,
+                out=np.zeros_like(peak),
+                where=peak > 0,
+            )
+            breached |= drawdown <= -self.trailing_stop_pct
+
         exit_signals = []
-        for symbol in list(self.positions.keys()):
-            signal = self.check_position(symbol)
+        for idx in np.flatnonzero(breached):
+            signal = self.check_position(symbols[idx])
             if signal:
                 exit_signals.append(signal)
         return exit_signals
@@ -385,6 +455,31 @@ class PortfolioMonitor:
 
         return False
 
+    def replay_values(self, values: Sequence[float]) -> np.ndarray:
+        """Evaluate the circuit breaker over a series of portfolio values.
+
+        Vectorized equivalent of calling update_value() then
+        check_circuit_breaker() for each value, starting from the current
+        peak and daily start. The monitor's own state is not modified.
+
+        Args:
+            values: Portfolio values in time order
+
+        Returns:
+            Boolean array, True where the circuit breaker would trigger
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if values.size == 0:
+            return np.zeros(0, dtype=bool)
+
+        peaks = np.maximum(np.maximum.accumulate(values), self.state.peak_value)
+        start = self.state.daily_start_value
+
+        daily_pnl = (values - start) / start if start != 0 else np.zeros_like(values)
+        drawdown = np.divide(values - peaks, peaks, out=np.zeros_like(values), where=peaks != 0)
+
+        return (daily_pnl <= -self.daily_loss_limit) | (drawdown <= -self.max_drawdown)
+
     def get_metrics(self) -> Dict[str, float]:
         """Get current portfolio risk metrics.
 
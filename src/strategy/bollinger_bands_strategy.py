@@ -98,9 +98,10 @@ class BollingerBandsStrategy(Strategy):
             num_std=self.params["num_std"],
         )
 
-        data["bb_upper"] = upper
-        data["bb_middle"] = middle
-        data["bb_lower"] = lower
+        # Bands share data's index, so attach the raw arrays and skip realignment
+        data["bb_upper"] = upper.to_numpy()
+        data["bb_middle"] = middle.to_numpy()
+        data["bb_lower"] = lower.to_numpy()
 
         logger.debug(
             "Calculated Bollinger Bands: period=%d, num_std=%.1f",
@@ -236,8 +236,9 @@ def obv(close: pd.Series, volume: pd.Series) -> pd.Series:
         >>> obv_values = obv(data['close'], data['volume'])
         >>> obv_trend = obv_values > obv_values.rolling(20).mean()
     """
-    # Convert volume to float64 (TA-Lib requires double type)
-    result = talib.OBV(close.values, volume.astype(np.float64).values)
+    # Convert volume to float64 (TA-Lib requires double type); to_numpy skips
+    # building an intermediate Series and does not copy float64 input
+    result = talib.OBV(close.values, volume.to_numpy(dtype=np.float64))
     return pd.Series(result, index=close.index, name="obv")
 
 
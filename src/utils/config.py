@@ -10,6 +10,9 @@ from typing import Any
 import yaml
 from dotenv import load_dotenv
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class Config:
     """Simple configuration loader and accessor.
@@ -48,7 +51,7 @@ class Config:
             raise FileNotFoundError(f"Configuration file not found: {filepath}")
 
         with open(path, "r", encoding="utf-8") as f:
-            config_dict = yaml.safe_load(f)
+            config_dict = yaml.load(f, Loader=_YAML_LOADER)
 
         if config_dict is None:
             config_dict = {}
@@ -0,0 +1,27 @@
+"""Shared pytest fixtures for the test suite."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Five consecutive calendar days (2024-01-01 to 2024-01-05), built once
+_DATES_5 = pd.DatetimeIndex(
+    np.arange("2024-01-01", "2024-01-06", dtype="datetime64[D]").astype("datetime64[ns]"),
+    name="date",
+)
+
+
+@pytest.fixture
+def fast_sqlite(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Let DatabaseManager skip fsyncs on the throwaway databases a test creates.
+
+    Request it only from fixtures that build databases under tmp_path, so a
+    DatabaseManager opened on the default data/ path keeps durable settings.
+    """
+    monkeypatch.setenv("AITRADER_TEST_DB", "1")
+
+
+@pytest.fixture(scope="session")
+def dates_5() -> pd.DatetimeIndex:
+    """Daily DatetimeIndex for 2024-01-01 through 2024-01-05."""
+    return _DATES_5
@@ -10,7 +10,7 @@ from src.api.universe_api import UniverseAPI
 
 
 @pytest.fixture
-def temp_db_path(tmp_path):
+def temp_db_path(tmp_path, fast_sqlite):
     """Temporary database path."""
     return str(tmp_path / "test_universe.db")
 
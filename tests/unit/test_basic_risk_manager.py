@@ -6,6 +6,12 @@ from src.risk.base import PositionRisk, RiskAction
 from src.risk.basic_risk_manager import BasicRiskManager
 
 
+@pytest.fixture(scope="class")
+def default_manager() -> BasicRiskManager:
+    """Create manager with default configuration (max_position_size=0.20)."""
+    return BasicRiskManager()
+
+
 class TestBasicRiskManagerConfig:
     """Test cases for BasicRiskManager configuration."""
 
@@ -36,44 +42,38 @@ class TestBasicRiskManagerConfig:
         assert manager.max_total_exposure == 0.80
         assert manager.min_cash_reserve == 0.10
 
-    def test_invalid_max_position_size_zero(self) -> None:
-        """Test config validation for zero max_position_size."""
-        with pytest.raises(ValueError, match="max_position_size must be in"):
-            BasicRiskManager({"max_position_size": 0})
-
-    def test_invalid_max_position_size_above_one(self) -> None:
-        """Test config validation for max_position_size > 1."""
-        with pytest.raises(ValueError, match="max_position_size must be in"):
-            BasicRiskManager({"max_position_size": 1.5})
-
-    def test_invalid_max_exposure_zero(self) -> None:
-        """Test config validation for zero max_total_exposure."""
-        with pytest.raises(ValueError, match="max_total_exposure must be in"):
-            BasicRiskManager({"max_total_exposure": 0})
-
-    def test_invalid_min_cash_negative(self) -> None:
-        """Test config validation for negative min_cash_reserve."""
-        with pytest.raises(ValueError, match="min_cash_reserve must be in"):
-            BasicRiskManager({"min_cash_reserve": -0.1})
-
-    def test_invalid_min_cash_one(self) -> None:
-        """Test config validation for min_cash_reserve = 1."""
-        with pytest.raises(ValueError, match="min_cash_reserve must be in"):
-            BasicRiskManager({"min_cash_reserve": 1.0})
-
-    def test_invalid_conflicting_exposure_cash(self) -> None:
-        """Test config validation for conflicting exposure and cash."""
-        # If exposure=90% and min_cash=15%, total would exceed 100%
-        with pytest.raises(ValueError, match="cannot exceed 1.0"):
-            BasicRiskManager({"max_total_exposure": 0.90, "min_cash_reserve": 0.15})
+    @pytest.mark.parametrize(
+        "config,match",
+        [
+            ({"max_position_size": 0}, "max_position_size must be in"),
+            ({"max_position_size": 1.5}, "max_position_size must be in"),
+            ({"max_total_exposure": 0}, "max_total_exposure must be in"),
+            ({"min_cash_reserve": -0.1}, "min_cash_reserve must be in"),
+            ({"min_cash_reserve": 1.0}, "min_cash_reserve must be in"),
+            # If exposure=90% and min_cash=15%, total would exceed 100%
+            ({"max_total_exposure": 0.90, "min_cash_reserve": 0.15}, "cannot exceed 1.0"),
+        ],
+        ids=[
+            "max_position_size_zero",
+            "max_position_size_above_one",
+            "max_exposure_zero",
+            "min_cash_negative",
+            "min_cash_one",
+            "conflicting_exposure_cash",
+        ],
+    )
+    def test_invalid_config(self, config: dict, match: str) -> None:
+        """Test config validation rejects out-of-range values."""
+        with pytest.raises(ValueError, match=match):
+            BasicRiskManager(config)
 
 
 class TestValidateWeights:
     """Test cases for validate_weights method."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def manager(self) -> BasicRiskManager:
-        """Create manager with test configuration."""
+        """Create manager with test configuration (stateless, shared per module)."""
         return BasicRiskManager(
             {
                 "max_position_size": 0.20,
@@ -146,18 +146,21 @@ class TestValidateWeights:
         # Cash should be at least 5%
         assert result.adjusted_weights["Cash"] >= 0.05
 
-    def test_weights_sum_to_one(self, manager: BasicRiskManager) -> None:
+    @pytest.mark.parametrize(
+        "weights",
+        [
+            {"AAPL": 0.50, "Cash": 0.50},
+            {"AAPL": 0.18, "MSFT": 0.18, "GOOGL": 0.18, "AMZN": 0.18, "NVDA": 0.18, "Cash": 0.10},
+            {"AAPL": 0.20, "MSFT": 0.78, "Cash": 0.02},
+        ],
+        ids=["position_violation", "exposure_violation", "multiple_violations"],
+    )
+    def test_weights_sum_to_one(self, manager: BasicRiskManager, weights: dict) -> None:
         """Test adjusted weights always sum to 1.0."""
-        test_cases = [
-            {"AAPL": 0.50, "Cash": 0.50},  # Position violation
-            {"AAPL": 0.18, "MSFT": 0.18, "GOOGL": 0.18, "AMZN": 0.18, "NVDA": 0.18, "Cash": 0.10},  # Exposure
-            {"AAPL": 0.20, "MSFT": 0.78, "Cash": 0.02},  # Multiple violations
-        ]
+        result = manager.validate_weights(weights)
 
-        for weights in test_cases:
-            result = manager.validate_weights(weights)
-            total = sum(result.adjusted_weights.values())
-            assert abs(total - 1.0) < 0.001, f"Weights don't sum to 1: {result.adjusted_weights}"
+        total = sum(result.adjusted_weights.values())
+        assert abs(total - 1.0) < 0.001, f"Weights don't sum to 1: {result.adjusted_weights}"
 
     def test_empty_portfolio_all_cash(self, manager: BasicRiskManager) -> None:
         """Test empty portfolio (all cash) is valid."""
@@ -182,9 +185,9 @@ class TestValidateWeights:
 class TestCheckPositionRisk:
     """Test cases for check_position_risk method."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def manager(self) -> BasicRiskManager:
-        """Create manager with test configuration."""
+        """Create manager with test configuration (stateless, shared per module)."""
         return BasicRiskManager(
             {
                 "stop_loss_pct": 0.08,
@@ -193,13 +196,30 @@ class TestCheckPositionRisk:
             }
         )
 
-    def test_no_exit_normal_position(self, manager: BasicRiskManager) -> None:
+    @pytest.fixture
+    def make_position(self):
+        """Factory for AAPL positions of 100 shares with per-test overrides."""
+
+        def _make(**overrides) -> PositionRisk:
+            params = {
+                "symbol": "AAPL",
+                "entry_price": 100.0,
+                "current_price": 100.0,
+                "shares": 100,
+                "pnl_pct": 0.0,
+            }
+            params.update(overrides)
+            return PositionRisk(**params)
+
+        return _make
+
+    def test_no_exit_normal_position(
+        self, manager: BasicRiskManager, make_position
+    ) -> None:
         """Test no exit signal for normal position."""
-        position = PositionRisk(
-            symbol="AAPL",
+        position = make_position(
             entry_price=150.0,
             current_price=155.0,  # +3.3% gain
-            shares=100,
             pnl_pct=0.033,
         )
 
@@ -207,13 +227,13 @@ class TestCheckPositionRisk:
 
         assert result is None
 
-    def test_stop_loss_triggered(self, manager: BasicRiskManager) -> None:
+    def test_stop_loss_triggered(
+        self, manager: BasicRiskManager, make_position
+    ) -> None:
         """Test stop-loss exit signal when loss exceeds threshold."""
-        position = PositionRisk(
-            symbol="AAPL",
+        position = make_position(
             entry_price=150.0,
             current_price=135.0,  # -10% loss
-            shares=100,
             pnl_pct=-0.10,
         )
 
@@ -225,13 +245,13 @@ class TestCheckPositionRisk:
         assert result.trigger_type == "stop_loss"
         assert "Stop-loss" in result.reason
 
-    def test_stop_loss_exactly_at_threshold(self, manager: BasicRiskManager) -> None:
+    def test_stop_loss_exactly_at_threshold(
+        self, manager: BasicRiskManager, make_position
+    ) -> None:
         """Test no exit when loss is exactly at threshold."""
-        position = PositionRisk(
-            symbol="AAPL",
+        position = make_position(
             entry_price=100.0,
             current_price=92.0,  # Exactly -8%
-            shares=100,
             pnl_pct=-0.08,
             peak_price=100.0,  # Peak same as entry, so no trailing stop trigger
         )
@@ -246,13 +266,13 @@ class TestCheckPositionRisk:
         assert result is not None
         assert result.trigger_type == "trailing_stop"
 
-    def test_take_profit_triggered(self, manager: BasicRiskManager) -> None:
+    def test_take_profit_triggered(
+        self, manager: BasicRiskManager, make_position
+    ) -> None:
         """Test take-profit exit signal when gain exceeds threshold."""
-        position = PositionRisk(
-            symbol="AAPL",
+        position = make_position(
             entry_price=100.0,
             current_price=130.0,  # +30% gain
-            shares=100,
             pnl_pct=0.30,
         )
 
@@ -262,13 +282,13 @@ class TestCheckPositionRisk:
         assert result.trigger_type == "take_profit"
         assert "Take-profit" in result.reason
 
-    def test_trailing_stop_triggered(self, manager: BasicRiskManager) -> None:
+    def test_trailing_stop_triggered(
+        self, manager: BasicRiskManager, make_position
+    ) -> None:
         """Test trailing stop exit when drawdown from peak exceeds threshold."""
-        position = PositionRisk(
-            symbol="AAPL",
+        position = make_position(
             entry_price=100.0,
             current_price=108.0,  # Still profitable from entry
-            shares=100,
             pnl_pct=0.08,
             peak_price=120.0,  # Was at $120, now at $108 = -10% from peak
         )
@@ -281,14 +301,14 @@ class TestCheckPositionRisk:
         assert result.trigger_type == "trailing_stop"
         assert "Trailing" in result.reason
 
-    def test_stop_loss_priority_over_trailing(self, manager: BasicRiskManager) -> None:
+    def test_stop_loss_priority_over_trailing(
+        self, manager: BasicRiskManager, make_position
+    ) -> None:
         """Test stop-loss takes priority when multiple triggers."""
         # Position is down 10% from entry AND 15% from peak
-        position = PositionRisk(
-            symbol="AAPL",
+        position = make_position(
             entry_price=100.0,
             current_price=90.0,
-            shares=100,
             pnl_pct=-0.10,  # Stop-loss trigger
             peak_price=105.0,
         )
@@ -304,9 +324,9 @@ class TestCheckPositionRisk:
 class TestGetRiskMetrics:
     """Test cases for get_risk_metrics method."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def manager(self) -> BasicRiskManager:
-        """Create manager with test configuration."""
+        """Create manager with test configuration (stateless, shared per module)."""
         return BasicRiskManager(
             {
                 "max_position_size": 0.20,
@@ -354,35 +374,32 @@ class TestGetRiskMetrics:
 class TestEdgeCases:
     """Test edge cases and boundary conditions."""
 
-    def test_no_cash_key_in_weights(self) -> None:
+    def test_no_cash_key_in_weights(self, default_manager: BasicRiskManager) -> None:
         """Test handling weights without Cash key."""
-        manager = BasicRiskManager()
         weights = {"AAPL": 0.20, "MSFT": 0.15}  # No Cash key, sum = 0.35
 
-        result = manager.validate_weights(weights)
+        result = default_manager.validate_weights(weights)
 
         # Should add Cash to make sum = 1.0
         assert "Cash" in result.adjusted_weights
         total = sum(result.adjusted_weights.values())
         assert abs(total - 1.0) < 0.001
 
-    def test_rounding_errors_handled(self) -> None:
+    def test_rounding_errors_handled(self, default_manager: BasicRiskManager) -> None:
         """Test rounding errors are corrected."""
-        manager = BasicRiskManager()
         # Weights that might cause floating point issues
         weights = {"AAPL": 0.1, "MSFT": 0.1, "GOOGL": 0.1, "Cash": 0.7}
 
-        result = manager.validate_weights(weights)
+        result = default_manager.validate_weights(weights)
 
         total = sum(result.adjusted_weights.values())
         assert abs(total - 1.0) < 0.001
 
-    def test_very_small_weights(self) -> None:
+    def test_very_small_weights(self, default_manager: BasicRiskManager) -> None:
         """Test handling very small position weights."""
-        manager = BasicRiskManager()
         weights = {"AAPL": 0.001, "Cash": 0.999}
 
-        result = manager.validate_weights(weights)
+        result = default_manager.validate_weights(weights)
 
         assert result.action == RiskAction.APPROVE
         # Small position should be preserved
@@ -6,17 +6,43 @@ import pytest
 
 from src.strategy.bollinger_bands_strategy import BollingerBandsStrategy
 
+# Price data with volatility for Bollinger Bands, drawn once at import
+_RNG = np.random.default_rng(42)
+_CLOSE = np.linspace(100, 105, 100) + _RNG.normal(0, 2, 100)
+_VOLUME = _RNG.integers(1_000_000, 5_000_000, 100, dtype=np.int64)
+_CLOSE.setflags(write=False)
+_VOLUME.setflags(write=False)
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def sample_data():
     """Create sample OHLCV data for testing."""
     dates = pd.date_range("2024-01-01", periods=100, freq="D")
 
-    # Create price data with volatility for Bollinger Bands
-    np.random.seed(42)
-    base_prices = np.linspace(100, 105, 100)
-    noise = np.random.normal(0, 2, 100)  # Add volatility
-    close_prices = base_prices + noise
+    data = pd.DataFrame(
+        {
+            "open": _CLOSE * 1.01,
+            "high": _CLOSE * 1.02,
+            "low": _CLOSE * 0.98,
+            "close": _CLOSE,
+            "volume": _VOLUME,
+        },
+        index=dates,
+    )
+    return data
+
+
+@pytest.fixture(scope="module")
+def spike_data():
+    """Create data where price clearly touches both bands."""
+    dates = pd.date_range("2024-01-01", periods=60, freq="D")
+
+    # Start stable, then spike up and down
+    close_prices = np.empty(60)
+    close_prices[:25] = 100  # Stable period
+    close_prices[25:35] = np.linspace(100, 115, 10)  # Sharp rise (touch upper band)
+    close_prices[35:45] = np.linspace(115, 85, 10)  # Sharp fall (touch lower band)
+    close_prices[45:] = 100  # Return to stable
 
     data = pd.DataFrame(
         {
@@ -24,13 +50,34 @@ def sample_data():
             "high": close_prices * 1.02,
             "low": close_prices * 0.98,
             "close": close_prices,
-            "volume": np.random.randint(1000000, 5000000, len(dates)),
+            "volume": np.full(60, 1_000_000, dtype=np.int64),
         },
         index=dates,
     )
     return data
 
 
+DEFAULT_CONFIG = {"period": 20, "num_std": 2.0, "min_required_rows": 50}
+
+
+@pytest.fixture(scope="module")
+def bb_indicators(sample_data):
+    """Calculate default Bollinger Bands on sample data once per module."""
+    return BollingerBandsStrategy(DEFAULT_CONFIG).calculate_indicators(sample_data)
+
+
+@pytest.fixture(scope="module")
+def bb_signals(sample_data):
+    """Generate default Bollinger Bands signals on sample data once per module."""
+    return BollingerBandsStrategy(DEFAULT_CONFIG).generate_signals(sample_data)
+
+
+@pytest.fixture
+def strategy(request):
+    """Create strategy from an indirectly parametrized configuration."""
+    return BollingerBandsStrategy(request.param)
+
+
 class TestBollingerBandsStrategyValidation:
     """Test parameter validation for Bollinger Bands Strategy."""
 
@@ -94,41 +141,22 @@ class TestBollingerBandsStrategyValidation:
 class TestBollingerBandsStrategyIndicators:
     """Test indicator calculation for Bollinger Bands Strategy."""
 
-    def test_calculate_indicators_adds_bb_columns(self, sample_data):
+    def test_calculate_indicators_adds_bb_columns(self, bb_indicators):
         """Test that calculate_indicators adds Bollinger Bands columns."""
-        strategy = BollingerBandsStrategy({
-            "period": 20,
-            "num_std": 2.0,
-            "min_required_rows": 50,
-        })
-        result = strategy.calculate_indicators(sample_data)
-        assert "bb_upper" in result.columns
-        assert "bb_middle" in result.columns
-        assert "bb_lower" in result.columns
+        assert "bb_upper" in bb_indicators.columns
+        assert "bb_middle" in bb_indicators.columns
+        assert "bb_lower" in bb_indicators.columns
 
-    def test_calculate_indicators_preserves_original(self, sample_data):
+    def test_calculate_indicators_preserves_original(self, bb_indicators, sample_data):
         """Test that original OHLCV columns are preserved."""
-        strategy = BollingerBandsStrategy({
-            "period": 20,
-            "num_std": 2.0,
-            "min_required_rows": 50,
-        })
-        result = strategy.calculate_indicators(sample_data)
         for col in ["open", "high", "low", "close", "volume"]:
-            assert col in result.columns
-            pd.testing.assert_series_equal(result[col], sample_data[col])
+            assert col in bb_indicators.columns
+            pd.testing.assert_series_equal(bb_indicators[col], sample_data[col])
 
-    def test_calculate_indicators_band_relationship(self, sample_data):
+    def test_calculate_indicators_band_relationship(self, bb_indicators):
         """Test that upper > middle > lower bands."""
-        strategy = BollingerBandsStrategy({
-            "period": 20,
-            "num_std": 2.0,
-            "min_required_rows": 50,
-        })
-        result = strategy.calculate_indicators(sample_data)
-
         # Remove NaN values for comparison
-        valid_data = result.dropna()
+        valid_data = bb_indicators.dropna()
 
         # Upper should be greater than middle
         assert (valid_data["bb_upper"] >= valid_data["bb_middle"]).all()
@@ -136,160 +164,93 @@ class TestBollingerBandsStrategyIndicators:
         # Middle should be greater than lower
         assert (valid_data["bb_middle"] >= valid_data["bb_lower"]).all()
 
-    def test_calculate_indicators_middle_is_sma(self, sample_data):
+    def test_calculate_indicators_middle_is_sma(self, bb_indicators, sample_data):
         """Test that middle band equals SMA of close prices."""
-        strategy = BollingerBandsStrategy({
-            "period": 20,
-            "num_std": 2.0,
-            "min_required_rows": 50,
-        })
-        result = strategy.calculate_indicators(sample_data)
-
         # Middle band should be close to rolling mean
         expected_middle = sample_data["close"].rolling(20).mean()
 
         # Compare non-NaN values
-        valid_idx = ~result["bb_middle"].isna()
-        pd.testing.assert_series_equal(
-            result.loc[valid_idx, "bb_middle"],
-            expected_middle.loc[valid_idx],
-            check_names=False,
-            atol=0.01,  # Small tolerance for floating point
-        )
+        valid_idx = ~bb_indicators["bb_middle"].isna()
+        actual = bb_indicators.loc[valid_idx, "bb_middle"].to_numpy(copy=False)
+        expected = expected_middle.loc[valid_idx].to_numpy(copy=False)
+        # Small tolerance for floating point
+        assert np.allclose(actual, expected, atol=0.01)
 
 
 class TestBollingerBandsStrategySignals:
     """Test signal generation for Bollinger Bands Strategy."""
 
-    def test_generate_signals_returns_series(self, sample_data):
+    def test_generate_signals_returns_series(self, bb_signals, sample_data):
         """Test that generate_signals returns a pandas Series."""
-        strategy = BollingerBandsStrategy({
-            "period": 20,
-            "num_std": 2.0,
-            "min_required_rows": 50,
-        })
-        signals = strategy.generate_signals(sample_data)
-        assert isinstance(signals, pd.Series)
-        assert len(signals) == len(sample_data)
+        assert isinstance(bb_signals, pd.Series)
+        assert len(bb_signals) == len(sample_data)
 
-    def test_generate_signals_range(self, sample_data):
+    def test_generate_signals_range(self, bb_signals):
         """Test that all signals are in valid range [-1.0, 1.0]."""
-        strategy = BollingerBandsStrategy({
-            "period": 20,
-            "num_std": 2.0,
-            "min_required_rows": 50,
-        })
-        signals = strategy.generate_signals(sample_data)
-        assert (signals >= -1.0).all()
-        assert (signals <= 1.0).all()
+        assert (bb_signals >= -1.0).all()
+        assert (bb_signals <= 1.0).all()
 
-    def test_generate_signals_only_valid_values(self, sample_data):
+    def test_generate_signals_only_valid_values(self, bb_signals):
         """Test that signals only contain -1.0, 0.0, or 1.0."""
-        strategy = BollingerBandsStrategy({
-            "period": 20,
-            "num_std": 2.0,
-            "min_required_rows": 50,
-        })
-        signals = strategy.generate_signals(sample_data)
-        unique_signals = signals.unique()
-        assert all(s in [-1.0, 0.0, 1.0] for s in unique_signals)
+        assert np.isin(bb_signals.to_numpy(), [-1.0, 0.0, 1.0]).all()
 
-    def test_generate_signals_mostly_hold(self, sample_data):
+    def test_generate_signals_mostly_hold(self, bb_signals):
         """Test that most signals are hold (0.0) for typical market data."""
-        strategy = BollingerBandsStrategy({
-            "period": 20,
-            "num_std": 2.0,
-            "min_required_rows": 50,
-        })
-        signals = strategy.generate_signals(sample_data)
         # Most signals should be hold for normal market conditions
-        hold_ratio = (signals == 0.0).sum() / len(signals)
+        hold_ratio = (bb_signals == 0.0).sum() / len(bb_signals)
         assert hold_ratio > 0.8  # At least 80% should be hold signals
 
-    def test_different_num_std_different_signals(self, sample_data):
+    @pytest.mark.parametrize(
+        "strategy,more_signals",
+        [
+            ({"period": 20, "num_std": 1.0, "min_required_rows": 50}, True),
+            ({"period": 20, "num_std": 3.0, "min_required_rows": 50}, False),
+        ],
+        ids=["narrow", "wide"],
+        indirect=["strategy"],
+    )
+    def test_different_num_std_different_signals(
+        self, strategy, more_signals, bb_signals, sample_data
+    ):
         """Test that different num_std values affect signal generation."""
-        # Narrow bands (1 std)
-        narrow = BollingerBandsStrategy({
-            "period": 20,
-            "num_std": 1.0,
-            "min_required_rows": 50,
-        })
+        count = (strategy.generate_signals(sample_data) != 0.0).sum()
+        default_count = (bb_signals != 0.0).sum()
 
-        # Wide bands (3 std)
-        wide = BollingerBandsStrategy({
-            "period": 20,
-            "num_std": 3.0,
-            "min_required_rows": 50,
-        })
-
-        narrow_signals = narrow.generate_signals(sample_data)
-        wide_signals = wide.generate_signals(sample_data)
-
-        # Narrow bands should generate more signals (price crosses bands more often)
-        narrow_count = (narrow_signals != 0.0).sum()
-        wide_count = (wide_signals != 0.0).sum()
-
-        assert narrow_count >= wide_count
+        # Narrow bands (1 std) cross more often than 2 std, wide bands (3 std) less
+        if more_signals:
+            assert count >= default_count
+        else:
+            assert count <= default_count
 
-    def test_generate_signals_detects_band_touches(self):
+    def test_generate_signals_detects_band_touches(self, spike_data):
         """Test that strategy detects price touching bands."""
-        # Create data where price clearly touches both bands
-        dates = pd.date_range("2024-01-01", periods=60, freq="D")
-
-        # Start stable, then spike up and down
-        close_prices = np.concatenate([
-            np.ones(25) * 100,         # Stable period
-            np.linspace(100, 115, 10), # Sharp rise (touch upper band)
-            np.linspace(115, 85, 10),  # Sharp fall (touch lower band)
-            np.ones(15) * 100,         # Return to stable
-        ])
-
-        data = pd.DataFrame({
-            "open": close_prices * 1.01,
-            "high": close_prices * 1.02,
-            "low": close_prices * 0.98,
-            "close": close_prices,
-            "volume": np.ones(60) * 1000000,
-        }, index=dates)
-
         strategy = BollingerBandsStrategy({
             "period": 20,
             "num_std": 2.0,
             "min_required_rows": 25,
         })
 
-        signals = strategy.generate_signals(data)
+        signals = strategy.generate_signals(spike_data)
 
         # Should have at least some signals from band touches
         total_signals = (signals != 0.0).sum()
         assert total_signals > 0
 
-    def test_custom_period(self, sample_data):
+    @pytest.mark.parametrize(
+        "strategy",
+        [
+            # Short period (10 days) - more responsive
+            {"period": 10, "num_std": 2.0, "min_required_rows": 15},
+            # Long period (30 days) - less responsive
+            {"period": 30, "num_std": 2.0, "min_required_rows": 35},
+        ],
+        ids=["short", "long"],
+        indirect=True,
+    )
+    def test_custom_period(self, strategy, sample_data):
         """Test that custom period affects signal generation."""
-        # Short period (10 days) - more responsive
-        short_period = BollingerBandsStrategy({
-            "period": 10,
-            "num_std": 2.0,
-            "min_required_rows": 15,
-        })
-
-        # Long period (30 days) - less responsive
-        long_period = BollingerBandsStrategy({
-            "period": 30,
-            "num_std": 2.0,
-            "min_required_rows": 35,
-        })
-
-        short_signals = short_period.generate_signals(sample_data)
-        long_signals = long_period.generate_signals(sample_data)
-
-        # Both should generate signals
-        assert isinstance(short_signals, pd.Series)
-        assert isinstance(long_signals, pd.Series)
-
-        # Verify they're different strategies
-        short_count = (short_signals != 0.0).sum()
-        long_count = (long_signals != 0.0).sum()
+        signals = strategy.generate_signals(sample_data)
 
-        # At least one should generate signals
-        assert short_count > 0 or long_count > 0
+        assert isinstance(signals, pd.Series)
+        assert len(signals) == len(sample_data)
+        assert (signals != 0.0).sum() > 0
@@ -4,7 +4,6 @@ import tempfile
 from pathlib import Path
 
 import pytest
-import yaml
 
 from src.utils.config import Config
 
@@ -15,20 +14,22 @@ class TestConfig:
     def test_from_file_valid_yaml(self, tmp_path: Path) -> None:
         """Test loading valid YAML configuration file."""
         config_file = tmp_path / "test_config.yaml"
-        config_data = {
+        config_file.write_bytes(
+            b"project:\n  name: test\n  version: '1.0'\nlogging:\n  level: DEBUG\n"
+        )
+
+        config = Config.from_file(config_file)
+        assert config.to_dict() == {
             "project": {"name": "test", "version": "1.0"},
             "logging": {"level": "DEBUG"},
         }
-        config_file.write_text(yaml.dump(config_data))
-
-        config = Config.from_file(config_file)
         assert config.get("project.name") == "test"
         assert config.get("logging.level") == "DEBUG"
 
     def test_from_file_empty_yaml(self, tmp_path: Path) -> None:
         """Test loading empty YAML file."""
         config_file = tmp_path / "empty.yaml"
-        config_file.write_text("")
+        config_file.write_bytes(b"")
 
         config = Config.from_file(config_file)
         assert config.to_dict() == {}
@@ -96,12 +97,17 @@ class TestConfig:
         assert config.get("key.nested", "default") == "default"
 
 
-def test_load_default_config() -> None:
-    """Integration test: Load the actual default.yaml config."""
+@pytest.fixture(scope="session")
+def default_config() -> Config:
+    """Load the actual default.yaml config once per session."""
     config_path = Path(__file__).parent.parent.parent / "config" / "default.yaml"
+    if not config_path.exists():
+        pytest.skip("config/default.yaml not found")
+    return Config.from_file(config_path)
+
 
-    if config_path.exists():
-        config = Config.from_file(config_path)
-        # Verify expected keys exist
-        assert config.get("project.name") is not None
-        assert config.get("logging.level") is not None
+def test_load_default_config(default_config: Config) -> None:
+    """Integration test: Load the actual default.yaml config."""
+    # Verify expected keys exist
+    assert default_config.get("project.name") is not None
+    assert default_config.get("logging.level") is not None
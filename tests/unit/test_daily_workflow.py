@@ -3,34 +3,71 @@
 Tests the daily trading workflows with mocked components.
 """
 
+import copy
 from datetime import datetime
-from unittest.mock import Mock, patch
+from unittest.mock import DEFAULT, Mock, patch
 
 import pandas as pd
 import pytest
 
-from src.execution.base import AccountInfo, OrderStatus, Position
+from src.execution.alpaca_executor import AlpacaExecutor
+from src.execution.base import AccountInfo, ExecutionOrder, OrderStatus, Position
 from src.orchestration.workflows import DailyWorkflow, WorkflowConfig
-from src.portfolio.base import Order, OrderAction
+from src.portfolio.base import AllocationResult, Order, OrderAction, PortfolioState
 from src.strategy.ma_crossover import MACrossoverStrategy
+from src.utils.alpaca_client import AlpacaClient
+from src.utils.exceptions import BrokerConnectionError, ExecutionError
+
+# Flat closes long enough for the 50/200-day MA calculation
+_MA_DATA = pd.DataFrame(
+    {"close": [150.0] * 250},
+    index=pd.date_range("2024-01-01", periods=250),
+)
+
+# Read-only broker snapshots shared by the workflow tests
+_MOCK_ACCOUNT = AccountInfo(
+    cash=50000.0,
+    portfolio_value=100000.0,
+    buying_power=75000.0,
+    positions_value=50000.0,
+)
+_MOCK_POSITIONS = {
+    "AAPL": Position(
+        symbol="AAPL",
+        shares=100,
+        avg_cost=150.0,
+        market_value=15500.0,
+        unrealized_pnl=500.0,
+    )
+}
+_CASH_ACCOUNT = AccountInfo(
+    cash=100000.0,
+    portfolio_value=100000.0,
+    buying_power=100000.0,
+    positions_value=0.0,
+)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_alpaca_client():
     """Create mock AlpacaClient."""
-    client = Mock()
-    client.with_retry = Mock(side_effect=lambda func, *args, **kwargs: func(*args, **kwargs))
+    client = Mock(spec_set=AlpacaClient)
+    client.with_retry = lambda func, *args, **kwargs: func(*args, **kwargs)
     return client
 
 
-@pytest.fixture
-def workflow_config():
-    """Create workflow configuration."""
-    strategy = MACrossoverStrategy({"fast_period": 50, "slow_period": 200})
+@pytest.fixture(scope="session")
+def ma_strategy():
+    """Create MA crossover strategy shared by all workflow tests."""
+    return MACrossoverStrategy({"fast_period": 50, "slow_period": 200})
 
+
+@pytest.fixture(scope="session")
+def workflow_config(ma_strategy):
+    """Create workflow configuration."""
     return WorkflowConfig(
         symbols=["AAPL", "MSFT", "GOOGL"],
-        strategy=strategy,
+        strategy=ma_strategy,
         initial_capital=100000.0,
         min_signal_threshold=0.3,
         max_positions=3,
@@ -39,12 +76,49 @@ def workflow_config():
     )
 
 
-@pytest.fixture
-def daily_workflow(mock_alpaca_client, workflow_config):
-    """Create DailyWorkflow instance with mocked client."""
+@pytest.fixture(scope="session")
+def workflow_template(mock_alpaca_client, workflow_config):
+    """Create DailyWorkflow instance with mocked client once per session."""
     return DailyWorkflow(mock_alpaca_client, workflow_config)
 
 
+@pytest.fixture
+def daily_workflow(mock_alpaca_client, workflow_template):
+    """Hand out a copy of the shared workflow.
+
+    Tests stub methods on the workflow components, so each test gets shallow
+    copies of them and the session template stays untouched.
+    """
+    mock_alpaca_client.reset_mock()
+    workflow = copy.copy(workflow_template)
+    for name in ("data_provider", "executor", "portfolio_manager", "risk_manager"):
+        setattr(workflow, name, copy.copy(getattr(workflow_template, name)))
+    return workflow
+
+
+@pytest.fixture(scope="session")
+def mock_executor():
+    """Create mock AlpacaExecutor shared across tests."""
+    return Mock(spec=AlpacaExecutor)
+
+
+@pytest.fixture
+def exec_mocks(daily_workflow, mock_executor):
+    """Install the shared mock executor on the workflow, reset after each test."""
+    daily_workflow.executor = mock_executor
+    yield mock_executor
+    mock_executor.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture
+def primed_executor(exec_mocks):
+    """Mock executor preloaded with the standard account and positions."""
+    exec_mocks.get_account_info.return_value = _MOCK_ACCOUNT
+    exec_mocks.get_positions.return_value = _MOCK_POSITIONS
+    exec_mocks.get_open_orders.return_value = []
+    return exec_mocks
+
+
 class TestDailyWorkflowInit:
     """Test DailyWorkflow initialization."""
 
@@ -62,47 +136,21 @@ class TestDailyWorkflowInit:
 class TestMarketOpenWorkflow:
     """Test market open workflow."""
 
-    def test_market_open_success(self, daily_workflow):
+    def test_market_open_success(self, daily_workflow, primed_executor):
         """Test successful market open workflow."""
-        # Mock account info
-        mock_account = AccountInfo(
-            cash=50000.0,
-            portfolio_value=100000.0,
-            buying_power=75000.0,
-            positions_value=50000.0,
-        )
-
-        # Mock positions
-        mock_positions = {
-            "AAPL": Position(
-                symbol="AAPL",
-                shares=100,
-                avg_cost=150.0,
-                market_value=15500.0,
-                unrealized_pnl=500.0,
-            )
-        }
-
-        daily_workflow.executor.get_account_info = Mock(return_value=mock_account)
-        daily_workflow.executor.get_positions = Mock(return_value=mock_positions)
-
         # Execute workflow
         result = daily_workflow.market_open_workflow()
 
         # Verify
         assert result["status"] == "success"
-        assert result["account_info"] == mock_account
-        assert result["positions"] == mock_positions
+        assert result["account_info"] == _MOCK_ACCOUNT
+        assert result["positions"] == _MOCK_POSITIONS
         assert "timestamp" in result
 
-    def test_market_open_connection_failure(self, daily_workflow):
+    def test_market_open_connection_failure(self, daily_workflow, exec_mocks):
         """Test market open workflow with connection failure."""
-        from src.utils.exceptions import BrokerConnectionError
-
         # Mock connection failure
-        daily_workflow.executor.get_account_info = Mock(
-            side_effect=Exception("Connection failed")
-        )
+        exec_mocks.get_account_info.side_effect = Exception("Connection failed")
 
         # Should raise BrokerConnectionError
         with pytest.raises(BrokerConnectionError):
@@ -112,44 +160,42 @@ class TestMarketOpenWorkflow:
 class TestRebalancingWorkflow:
     """Test rebalancing workflow."""
 
-    @patch.object(DailyWorkflow, "_fetch_latest_data")
-    @patch.object(DailyWorkflow, "_generate_signals")
-    @patch.object(DailyWorkflow, "_build_portfolio_state")
-    def test_rebalancing_success(
-        self,
-        mock_build_portfolio,
-        mock_generate_signals,
-        mock_fetch_data,
-        daily_workflow,
-    ):
+    @pytest.fixture
+    def rebalancing_mocks(self, daily_workflow):
+        """Patch the data, signal and portfolio-state steps in one go."""
+        with patch.multiple(
+            daily_workflow,
+            _fetch_latest_data=DEFAULT,
+            _generate_signals=DEFAULT,
+            _build_portfolio_state=DEFAULT,
+        ) as mocks:
+            yield mocks
+
+    def test_rebalancing_success(self, daily_workflow, rebalancing_mocks, exec_mocks, dates_5):
         """Test successful rebalancing workflow."""
         # Mock data fetching
         mock_data = {
             "AAPL": pd.DataFrame(
                 {"close": [150.0, 151.0, 152.0]},
-                index=pd.date_range("2024-01-01", periods=3),
+                index=dates_5[:3],
             )
         }
-        mock_fetch_data.return_value = mock_data
+        rebalancing_mocks["_fetch_latest_data"].return_value = mock_data
 
         # Mock signal generation
         mock_signals = {"AAPL": 0.5, "MSFT": -0.3, "GOOGL": 0.8}
-        mock_generate_signals.return_value = mock_signals
+        rebalancing_mocks["_generate_signals"].return_value = mock_signals
 
         # Mock portfolio state
-        from src.portfolio.base import PortfolioState
-
         mock_portfolio_state = PortfolioState(
             positions={},
             total_value=100000.0,
             cash=100000.0,
             prices={"AAPL": 150.0, "MSFT": 300.0, "GOOGL": 140.0},
         )
-        mock_build_portfolio.return_value = mock_portfolio_state
+        rebalancing_mocks["_build_portfolio_state"].return_value = mock_portfolio_state
 
         # Mock portfolio allocation
-        from src.portfolio.base import AllocationResult
-
         mock_orders = [
             Order(
                 action=OrderAction.BUY,
@@ -171,17 +217,13 @@ class TestRebalancingWorkflow:
         daily_workflow.risk_manager.validate_orders = Mock(return_value=mock_orders)
 
         # Mock order execution
-        from src.execution.base import ExecutionOrder
-
         mock_execution_result = ExecutionOrder(
             order_id="order-123",
             order=mock_orders[0],
             status=OrderStatus.SUBMITTED,
         )
 
-        daily_workflow.executor.submit_orders = Mock(
-            return_value=[mock_execution_result]
-        )
+        exec_mocks.submit_orders.return_value = [mock_execution_result]
 
         # Execute workflow
         result = daily_workflow.rebalancing_workflow()
@@ -193,13 +235,10 @@ class TestRebalancingWorkflow:
         assert result["orders_successful"] == 1
         assert result["orders_rejected"] == 0
 
-    @patch.object(DailyWorkflow, "_fetch_latest_data")
-    def test_rebalancing_data_fetch_failure(self, mock_fetch_data, daily_workflow):
+    def test_rebalancing_data_fetch_failure(self, daily_workflow, rebalancing_mocks):
         """Test rebalancing workflow with data fetch failure."""
-        from src.utils.exceptions import ExecutionError
-
         # Mock data fetch failure
-        mock_fetch_data.side_effect = Exception("Data fetch failed")
+        rebalancing_mocks["_fetch_latest_data"].side_effect = Exception("Data fetch failed")
 
         # Should raise ExecutionError
         with pytest.raises(ExecutionError):
@@ -209,34 +248,8 @@ class TestRebalancingWorkflow:
 class TestMarketCloseWorkflow:
     """Test market close workflow."""
 
-    def test_market_close_success(self, daily_workflow):
+    def test_market_close_success(self, daily_workflow, primed_executor):
         """Test successful market close workflow."""
-        # Mock open orders
-        daily_workflow.executor.get_open_orders = Mock(return_value=[])
-
-        # Mock positions
-        mock_positions = {
-            "AAPL": Position(
-                symbol="AAPL",
-                shares=100,
-                avg_cost=150.0,
-                market_value=15500.0,
-                unrealized_pnl=500.0,
-            )
-        }
-
-        daily_workflow.executor.get_positions = Mock(return_value=mock_positions)
-
-        # Mock account info
-        mock_account = AccountInfo(
-            cash=50000.0,
-            portfolio_value=100000.0,
-            buying_power=75000.0,
-            positions_value=50000.0,
-        )
-
-        daily_workflow.executor.get_account_info = Mock(return_value=mock_account)
-
         # Execute workflow
         result = daily_workflow.market_close_workflow()
 
@@ -247,10 +260,8 @@ class TestMarketCloseWorkflow:
         assert result["portfolio_value"] == 100000.0
         assert result["total_unrealized_pnl"] == 500.0
 
-    def test_market_close_with_open_orders(self, daily_workflow):
+    def test_market_close_with_open_orders(self, daily_workflow, primed_executor):
         """Test market close workflow with open orders."""
-        from src.execution.base import ExecutionOrder
-
         # Mock open order
         mock_order = ExecutionOrder(
             order_id="order-123",
@@ -263,17 +274,9 @@ class TestMarketCloseWorkflow:
             status=OrderStatus.SUBMITTED,
         )
 
-        daily_workflow.executor.get_open_orders = Mock(return_value=[mock_order])
-        daily_workflow.executor.get_positions = Mock(return_value={})
-
-        mock_account = AccountInfo(
-            cash=100000.0,
-            portfolio_value=100000.0,
-            buying_power=100000.0,
-            positions_value=0.0,
-        )
-
-        daily_workflow.executor.get_account_info = Mock(return_value=mock_account)
+        primed_executor.get_open_orders.return_value = [mock_order]
+        primed_executor.get_positions.return_value = {}
+        primed_executor.get_account_info.return_value = _CASH_ACCOUNT
 
         # Execute workflow (should log warning but not fail)
         result = daily_workflow.market_close_workflow()
@@ -286,7 +289,7 @@ class TestMarketCloseWorkflow:
 class TestWorkflowHelperMethods:
     """Test workflow helper methods."""
 
-    def test_fetch_latest_data(self, daily_workflow):
+    def test_fetch_latest_data(self, daily_workflow, dates_5):
         """Test _fetch_latest_data method."""
         # Mock data provider
         mock_df = pd.DataFrame(
@@ -297,7 +300,7 @@ class TestWorkflowHelperMethods:
                 "close": [151.0, 152.0],
                 "volume": [1000000, 1100000],
             },
-            index=pd.date_range("2024-01-01", periods=2),
+            index=dates_5[:2],
         )
 
         daily_workflow.data_provider.get_historical_bars = Mock(return_value=mock_df)
@@ -310,50 +313,22 @@ class TestWorkflowHelperMethods:
         assert "MSFT" in result
         assert "GOOGL" in result
 
+    @pytest.mark.slow
     def test_generate_signals(self, daily_workflow):
         """Test _generate_signals method."""
-        # Mock data
-        mock_data = {
-            "AAPL": pd.DataFrame(
-                {"close": [150.0] * 250},  # 250 days for MA calculation
-                index=pd.date_range("2024-01-01", periods=250),
-            )
-        }
-
         # Execute
-        result = daily_workflow._generate_signals(mock_data)
+        result = daily_workflow._generate_signals({"AAPL": _MA_DATA})
 
         # Verify
         assert "AAPL" in result
         assert isinstance(result["AAPL"], float)
 
-    def test_build_portfolio_state(self, daily_workflow):
+    def test_build_portfolio_state(self, daily_workflow, primed_executor, dates_5):
         """Test _build_portfolio_state method."""
-        # Mock executor responses
-        mock_positions = {
-            "AAPL": Position(
-                symbol="AAPL",
-                shares=100,
-                avg_cost=150.0,
-                market_value=15500.0,
-                unrealized_pnl=500.0,
-            )
-        }
-
-        mock_account = AccountInfo(
-            cash=50000.0,
-            portfolio_value=100000.0,
-            buying_power=75000.0,
-            positions_value=50000.0,
-        )
-
-        daily_workflow.executor.get_positions = Mock(return_value=mock_positions)
-        daily_workflow.executor.get_account_info = Mock(return_value=mock_account)
-
         # Mock data with latest prices
         mock_data = {
             "AAPL": pd.DataFrame(
-                {"close": [152.0]}, index=pd.date_range("2024-01-01", periods=1)
+                {"close": [152.0]}, index=dates_5[:1]
             )
         }
 
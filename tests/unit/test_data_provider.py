@@ -1,5 +1,6 @@
 """Unit tests for DataProvider interface."""
 
+import functools
 from datetime import datetime
 
 import pandas as pd
@@ -8,6 +9,22 @@ import pytest
 from src.data.base import DataProvider
 
 
+@functools.lru_cache(maxsize=32)
+def _sample_frame(start_date: datetime, end_date: datetime) -> pd.DataFrame:
+    """Build the flat sample OHLCV frame for a date range once."""
+    dates = pd.date_range(start=start_date, end=end_date, freq="D", name="date")
+    return pd.DataFrame(
+        {
+            "open": [100.0] * len(dates),
+            "high": [105.0] * len(dates),
+            "low": [95.0] * len(dates),
+            "close": [102.0] * len(dates),
+            "volume": [1000000] * len(dates),
+        },
+        index=dates,
+    )
+
+
 class ConcreteDataProvider(DataProvider):
     """Concrete implementation for testing purposes."""
 
@@ -29,18 +46,8 @@ class ConcreteDataProvider(DataProvider):
         if self._data is not None:
             return self._data
 
-        # Return sample data
-        dates = pd.date_range(start=start_date, end=end_date, freq="D")
-        return pd.DataFrame(
-            {
-                "open": [100.0] * len(dates),
-                "high": [105.0] * len(dates),
-                "low": [95.0] * len(dates),
-                "close": [102.0] * len(dates),
-                "volume": [1000000] * len(dates),
-            },
-            index=pd.DatetimeIndex(dates, name="date"),
-        )
+        # Return sample data (shallow copy so callers can't rebind the cached frame)
+        return _sample_frame(start_date, end_date).copy(deep=False)
 
     def get_trading_days(
         self,
@@ -142,14 +149,13 @@ class TestDataProviderInterface:
         # Should return our custom data
         pd.testing.assert_frame_equal(result, custom_data)
 
-    def test_provider_interface_with_different_symbols(self) -> None:
+    @pytest.mark.parametrize("symbol", ["AAPL", "TSLA", "GOOGL"])
+    def test_provider_interface_with_different_symbols(self, symbol: str) -> None:
         """Test provider can handle different symbols."""
         provider = ConcreteDataProvider()
 
-        symbols = ["AAPL", "TSLA", "GOOGL"]
-        for symbol in symbols:
-            result = provider.get_historical_bars(
-                symbol, datetime(2024, 1, 1), datetime(2024, 1, 1)
-            )
-            assert isinstance(result, pd.DataFrame)
-            assert len(result) == 1
+        result = provider.get_historical_bars(
+            symbol, datetime(2024, 1, 1), datetime(2024, 1, 1)
+        )
+        assert isinstance(result, pd.DataFrame)
+        assert len(result) == 1
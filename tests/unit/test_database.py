@@ -1,23 +1,25 @@
 """Unit tests for DatabaseManager."""
 
-import tempfile
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
+from unittest.mock import Mock
 
+import numpy as np
 import pandas as pd
 import pytest
 
 from src.data.storage.database import DatabaseManager
+from src.utils.exceptions import DataError
 
 
 class TestDatabaseManager:
     """Test cases for DatabaseManager."""
 
     @pytest.fixture
-    def temp_db(self) -> str:
-        """Create temporary database file."""
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".db") as f:
-            return f.name
+    def temp_db(self, tmp_path: Path, fast_sqlite: None) -> str:
+        """Create temporary database path (cleaned up by pytest)."""
+        return str(tmp_path / "test.db")
 
     @pytest.fixture
     def db_manager(self, temp_db: str) -> DatabaseManager:
@@ -25,18 +27,26 @@ class TestDatabaseManager:
         return DatabaseManager(temp_db)
 
     @pytest.fixture
+    def mem_db_manager(self) -> DatabaseManager:
+        """Create DatabaseManager backed by an in-memory SQLite database."""
+        manager = DatabaseManager(":memory:")
+        yield manager
+        manager.close()
+
+    @pytest.fixture(scope="session")
     def sample_bars(self) -> pd.DataFrame:
-        """Create sample OHLCV data."""
-        dates = pd.date_range(start="2024-01-01", end="2024-01-05", freq="D")
+        """Create sample OHLCV data once per session (tests only read it)."""
+        dates = pd.date_range(start="2024-01-01", end="2024-01-05", freq="D", name="date")
         return pd.DataFrame(
             {
-                "open": [150.0, 151.0, 152.0, 153.0, 154.0],
-                "high": [155.0, 156.0, 157.0, 158.0, 159.0],
-                "low": [148.0, 149.0, 150.0, 151.0, 152.0],
-                "close": [152.0, 153.0, 154.0, 155.0, 156.0],
-                "volume": [1000000, 1100000, 1200000, 1300000, 1400000],
+                "open": np.arange(150.0, 155.0),
+                "high": np.arange(155.0, 160.0),
+                "low": np.arange(148.0, 153.0),
+                "close": np.arange(152.0, 157.0),
+                "volume": np.arange(1_000_000, 1_500_000, 100_000, dtype=np.int64),
             },
-            index=pd.DatetimeIndex(dates, name="date"),
+            index=dates,
+            copy=False,
         )
 
     def test_database_initialization(self, db_manager: DatabaseManager, temp_db: str) -> None:
@@ -44,15 +54,39 @@ class TestDatabaseManager:
         assert Path(temp_db).exists()
         assert db_manager.db_path == temp_db
 
+    @pytest.mark.parametrize(
+        "env_flag,expected_sync",
+        [("1", 0), ("0", 2), (None, 2)],
+        ids=["test_db", "disabled", "unset"],
+    )
+    def test_fast_pragmas_follow_env_flag(
+        self,
+        temp_db: str,
+        monkeypatch: pytest.MonkeyPatch,
+        env_flag: Optional[str],
+        expected_sync: int,
+    ) -> None:
+        """Test AITRADER_TEST_DB switches file databases to synchronous=OFF."""
+        if env_flag is None:
+            monkeypatch.delenv("AITRADER_TEST_DB")
+        else:
+            monkeypatch.setenv("AITRADER_TEST_DB", env_flag)
+        manager = DatabaseManager(temp_db)
+
+        sync = manager._get_connection().execute("PRAGMA synchronous").fetchone()[0]
+        manager.close()
+
+        assert sync == expected_sync
+
     def test_save_and_load_bars(
-        self, db_manager: DatabaseManager, sample_bars: pd.DataFrame
+        self, mem_db_manager: DatabaseManager, sample_bars: pd.DataFrame
     ) -> None:
         """Test saving and loading OHLCV bars."""
         # Save data
-        db_manager.save_bars(sample_bars, "AAPL")
+        mem_db_manager.save_bars(sample_bars, "AAPL")
 
         # Load data back
-        result = db_manager.load_bars(
+        result = mem_db_manager.load_bars(
             "AAPL",
             datetime(2024, 1, 1),
             datetime(2024, 1, 5),
@@ -64,12 +98,43 @@ class TestDatabaseManager:
         assert list(result.columns) == ["open", "high", "low", "close", "volume"]
         assert result.index.name == "date"
 
-        # Verify data values (ignore freq attribute)
-        pd.testing.assert_frame_equal(result, sample_bars, check_dtype=False, check_freq=False)
+        # Verify data values
+        assert result.index.equals(sample_bars.index)
+        assert np.array_equal(result.to_numpy(copy=False), sample_bars.to_numpy(copy=False))
+
+    @pytest.mark.parametrize("n_rows", [5, 10_000], ids=["small", "10k_rows"])
+    def test_save_bars_batch_sizes(self, mem_db_manager: DatabaseManager, n_rows: int) -> None:
+        """Test save_bars round-trips small and large batches in one call."""
+        dates = pd.date_range(start="2000-01-01", periods=n_rows, freq="D", name="date")
+        close = np.arange(n_rows, dtype=np.float64) + 100.0
+        bars = pd.DataFrame(
+            {
+                "open": close,
+                "high": close + 1.0,
+                "low": close - 1.0,
+                "close": close,
+                "volume": np.full(n_rows, 1_000_000, dtype=np.int64),
+            },
+            index=dates,
+        )
+
+        mem_db_manager.save_bars(bars, "AAPL")
+        result = mem_db_manager.load_bars("AAPL", dates[0].to_pydatetime(), dates[-1].to_pydatetime())
+
+        assert len(result) == n_rows
+        assert np.array_equal(result["close"].to_numpy(), close)
+        assert (result["volume"] == 1_000_000).all()
 
-    def test_load_empty_symbol(self, db_manager: DatabaseManager) -> None:
+    def test_save_bars_missing_column_raises_data_error(
+        self, mem_db_manager: DatabaseManager, sample_bars: pd.DataFrame
+    ) -> None:
+        """Test a frame without one of the OHLCV columns raises DataError."""
+        with pytest.raises(DataError, match="volume"):
+            mem_db_manager.save_bars(sample_bars.drop(columns="volume"), "AAPL")
+
+    def test_load_empty_symbol(self, mem_db_manager: DatabaseManager) -> None:
         """Test loading non-existent symbol returns empty DataFrame."""
-        result = db_manager.load_bars(
+        result = mem_db_manager.load_bars(
             "NONEXISTENT",
             datetime(2024, 1, 1),
             datetime(2024, 1, 5),
@@ -79,19 +144,20 @@ class TestDatabaseManager:
         assert result.empty
 
     def test_incremental_save(
-        self, db_manager: DatabaseManager, sample_bars: pd.DataFrame
+        self, mem_db_manager: DatabaseManager, sample_bars: pd.DataFrame
     ) -> None:
         """Test incremental data saving (UPSERT behavior)."""
-        # Save first 3 days
-        first_chunk = sample_bars.iloc[:3]
-        db_manager.save_bars(first_chunk, "AAPL")
+        with mem_db_manager.bulk_writer():
+            # Save first 3 days
+            first_chunk = sample_bars.iloc[:3]
+            mem_db_manager.save_bars(first_chunk, "AAPL")
 
-        # Save last 3 days (overlap with day 3)
-        second_chunk = sample_bars.iloc[2:]
-        db_manager.save_bars(second_chunk, "AAPL")
+            # Save last 3 days (overlap with day 3)
+            second_chunk = sample_bars.iloc[2:]
+            mem_db_manager.save_bars(second_chunk, "AAPL")
 
         # Load all data
-        result = db_manager.load_bars(
+        result = mem_db_manager.load_bars(
             "AAPL",
             datetime(2024, 1, 1),
             datetime(2024, 1, 5),
@@ -99,17 +165,19 @@ class TestDatabaseManager:
 
         # Should have all 5 days without duplicates
         assert len(result) == 5
-        pd.testing.assert_frame_equal(result, sample_bars, check_dtype=False, check_freq=False)
+        assert list(result.columns) == list(sample_bars.columns)
+        assert result.index.equals(sample_bars.index)
+        assert np.array_equal(result.to_numpy(copy=False), sample_bars.to_numpy(copy=False))
 
     def test_date_range_filtering(
-        self, db_manager: DatabaseManager, sample_bars: pd.DataFrame
+        self, mem_db_manager: DatabaseManager, sample_bars: pd.DataFrame
     ) -> None:
         """Test loading with date range filtering."""
         # Save all data
-        db_manager.save_bars(sample_bars, "AAPL")
+        mem_db_manager.save_bars(sample_bars, "AAPL")
 
         # Load subset
-        result = db_manager.load_bars(
+        result = mem_db_manager.load_bars(
             "AAPL",
             datetime(2024, 1, 2),
             datetime(2024, 1, 4),
@@ -120,21 +188,55 @@ class TestDatabaseManager:
         assert result.index[0] == pd.Timestamp("2024-01-02")
         assert result.index[-1] == pd.Timestamp("2024-01-04")
 
+    def test_load_bars_uses_parametrized_query(
+        self,
+        mem_db_manager: DatabaseManager,
+        sample_bars: pd.DataFrame,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test load_bars reuses one SQL template and binds values per call."""
+        mem_db_manager.save_bars(sample_bars, "AAPL")
+        read_sql = Mock(wraps=pd.read_sql_query)
+        monkeypatch.setattr(pd, "read_sql_query", read_sql)
+
+        mem_db_manager.load_bars("AAPL", datetime(2024, 1, 1), datetime(2024, 1, 5))
+        mem_db_manager.load_bars("AAPL", datetime(2024, 1, 2), datetime(2024, 1, 4))
+
+        queries = [call.args[0] for call in read_sql.call_args_list]
+        params = [call.kwargs["params"] for call in read_sql.call_args_list]
+        assert queries == [DatabaseManager._LOAD_BARS_SQL] * 2
+        assert params == [("AAPL", "2024-01-01", "2024-01-05"), ("AAPL", "2024-01-02", "2024-01-04")]
+
     def test_multiple_symbols(
-        self, db_manager: DatabaseManager, sample_bars: pd.DataFrame
+        self, mem_db_manager: DatabaseManager, sample_bars: pd.DataFrame
     ) -> None:
         """Test storing data for multiple symbols."""
-        # Save same data for multiple symbols
-        db_manager.save_bars(sample_bars, "AAPL")
-        db_manager.save_bars(sample_bars, "GOOGL")
+        # Save same data for multiple symbols in one transaction
+        with mem_db_manager.bulk_writer():
+            mem_db_manager.save_bars(sample_bars, "AAPL")
+            mem_db_manager.save_bars(sample_bars, "GOOGL")
 
         # Load each separately
-        aapl_data = db_manager.load_bars("AAPL", datetime(2024, 1, 1), datetime(2024, 1, 5))
-        googl_data = db_manager.load_bars("GOOGL", datetime(2024, 1, 1), datetime(2024, 1, 5))
+        aapl_data = mem_db_manager.load_bars("AAPL", datetime(2024, 1, 1), datetime(2024, 1, 5))
+        googl_data = mem_db_manager.load_bars("GOOGL", datetime(2024, 1, 1), datetime(2024, 1, 5))
 
         # Both should have data
         assert len(aapl_data) == 5
         assert len(googl_data) == 5
 
         # Verify they're independent
-        pd.testing.assert_frame_equal(aapl_data, googl_data, check_dtype=False, check_freq=False)
+        assert list(aapl_data.columns) == list(googl_data.columns)
+        assert aapl_data.index.equals(googl_data.index)
+        assert np.array_equal(aapl_data.to_numpy(copy=False), googl_data.to_numpy(copy=False))
+
+    def test_bulk_writer_rolls_back_on_error(
+        self, mem_db_manager: DatabaseManager, sample_bars: pd.DataFrame
+    ) -> None:
+        """Test bulk_writer discards every write in the block if it raises."""
+        with pytest.raises(RuntimeError):
+            with mem_db_manager.bulk_writer():
+                mem_db_manager.save_bars(sample_bars, "AAPL")
+                raise RuntimeError("abort")
+
+        result = mem_db_manager.load_bars("AAPL", datetime(2024, 1, 1), datetime(2024, 1, 5))
+        assert result.empty
@@ -4,28 +4,81 @@ Tests the DynamicRiskManager class for combined static validation
 and dynamic position monitoring.
 """
 
+from types import MappingProxyType
+from unittest.mock import Mock
+
+import numpy as np
 import pytest
 
 from src.execution.base import Position
 from src.risk.dynamic_risk_manager import DynamicRiskManager
 
 
+@pytest.fixture(scope="class")
+def default_manager():
+    """Default-configured manager shared by the tests in a class."""
+    return DynamicRiskManager()
+
+
+@pytest.fixture
+def fresh_manager(default_manager):
+    """Yield the class's default manager, restoring its state after each test."""
+    snap = default_manager.snapshot()
+    yield default_manager
+    default_manager.restore(snap)
+
+
+@pytest.fixture(scope="module")
+def sample_config():
+    """Read-only nested config shared by the from_config tests."""
+    return MappingProxyType(
+        {
+            "portfolio": MappingProxyType(
+                {
+                    "max_position_size": 0.15,
+                    "min_position_size": 0.03,
+                    "cash_buffer": 0.10,
+                    "initial_capital": 150000.0,
+                }
+            ),
+            "alpaca": MappingProxyType(
+                {
+                    "risk_monitoring": MappingProxyType(
+                        {
+                            "max_total_exposure": 0.90,
+                            "stop_loss_pct": 0.04,
+                            "take_profit_pct": 0.12,
+                            "trailing_stop_pct": 0.06,
+                            "daily_loss_limit": 0.025,
+                            "max_drawdown": 0.08,
+                        }
+                    )
+                }
+            ),
+        }
+    )
+
+
 class TestDynamicRiskManagerInitialization:
     """Tests for DynamicRiskManager initialization."""
 
-    def test_initialization_default_values(self):
+    @pytest.mark.parametrize(
+        "attr,expected",
+        [
+            ("max_position_size", 0.20),
+            ("min_position_size", 0.02),
+            ("max_total_exposure", 0.95),
+            ("cash_buffer", 0.05),
+            ("stop_loss_pct", 0.03),
+            ("take_profit_pct", 0.10),
+            ("trailing_stop_pct", None),
+            ("daily_loss_limit", 0.02),
+            ("max_drawdown", 0.05),
+        ],
+    )
+    def test_initialization_default_values(self, default_manager, attr, expected):
         """Test initialization with default parameters."""
-        manager = DynamicRiskManager()
-
-        assert manager.max_position_size == 0.20
-        assert manager.min_position_size == 0.02
-        assert manager.max_total_exposure == 0.95
-        assert manager.cash_buffer == 0.05
-        assert manager.stop_loss_pct == 0.03
-        assert manager.take_profit_pct == 0.10
-        assert manager.trailing_stop_pct is None
-        assert manager.daily_loss_limit == 0.02
-        assert manager.max_drawdown == 0.05
+        assert getattr(default_manager, attr) == expected
 
     def test_initialization_custom_values(self):
         """Test initialization with custom parameters."""
@@ -46,28 +99,9 @@ class TestDynamicRiskManagerInitialization:
         assert manager.daily_loss_limit == 0.03
         assert manager.max_drawdown == 0.10
 
-    def test_from_config(self):
+    def test_from_config(self, sample_config):
         """Test initialization from configuration dict."""
-        config = {
-            "portfolio": {
-                "max_position_size": 0.15,
-                "min_position_size": 0.03,
-                "cash_buffer": 0.10,
-                "initial_capital": 150000.0,
-            },
-            "alpaca": {
-                "risk_monitoring": {
-                    "max_total_exposure": 0.90,
-                    "stop_loss_pct": 0.04,
-                    "take_profit_pct": 0.12,
-                    "trailing_stop_pct": 0.06,
-                    "daily_loss_limit": 0.025,
-                    "max_drawdown": 0.08,
-                }
-            },
-        }
-
-        manager = DynamicRiskManager.from_config(config)
+        manager = DynamicRiskManager.from_config(sample_config)
 
         assert manager.max_position_size == 0.15
         assert manager.min_position_size == 0.03
@@ -107,9 +141,9 @@ class TestDynamicRiskManagerPreTradeValidation:
 class TestDynamicRiskManagerPositionTracking:
     """Tests for position tracking and monitoring."""
 
-    def test_start_position(self):
+    def test_start_position(self, fresh_manager):
         """Test starting to track a position."""
-        manager = DynamicRiskManager()
+        manager = fresh_manager
         manager.start_position("AAPL", entry_price=150.0, shares=100)
 
         risks = manager.get_position_risks()
@@ -117,24 +151,44 @@ class TestDynamicRiskManagerPositionTracking:
         assert risks[0].symbol == "AAPL"
         assert risks[0].entry_price == 150.0
 
-    def test_close_position(self):
+    def test_close_position(self, fresh_manager):
         """Test closing a tracked position."""
-        manager = DynamicRiskManager()
+        manager = fresh_manager
         manager.start_position("AAPL", entry_price=150.0, shares=100)
         manager.close_position("AAPL")
 
         risks = manager.get_position_risks()
         assert len(risks) == 0
 
-    def test_update_prices(self):
+    def test_update_prices(self, fresh_manager):
         """Test updating prices for tracked positions."""
-        manager = DynamicRiskManager()
+        manager = fresh_manager
         manager.start_position("AAPL", entry_price=150.0, shares=100)
         manager.update_prices({"AAPL": 155.0})
 
         risks = manager.get_position_risks()
         assert risks[0].current_price == 155.0
 
+    def test_snapshot_restore(self):
+        """Test restore() rolls positions and portfolio state back to a snapshot."""
+        manager = DynamicRiskManager(initial_portfolio_value=100000.0, daily_loss_limit=0.02)
+        manager.start_position("AAPL", entry_price=150.0, shares=100)
+        snap = manager.snapshot()
+
+        manager.update_prices({"AAPL": 160.0})
+        manager.start_position("MSFT", entry_price=300.0, shares=50)
+        manager.update_portfolio_value(97000.0)
+        manager.check_circuit_breaker()
+
+        manager.restore(snap)
+
+        risks = manager.get_position_risks()
+        assert [risk.symbol for risk in risks] == ["AAPL"]
+        assert risks[0].current_price == 150.0
+        assert manager.get_portfolio_metrics()["portfolio_value"] == 100000.0
+        assert not manager.is_circuit_breaker_active()
+        assert manager.get_summary()["positions_tracked"] == 1
+
     def test_check_all_positions_stop_loss(self):
         """Test detecting stop-loss trigger."""
         manager = DynamicRiskManager(stop_loss_pct=0.05)
@@ -162,9 +216,11 @@ class TestDynamicRiskManagerPositionTracking:
     def test_check_all_positions_multiple_triggers(self):
         """Test detecting multiple position triggers."""
         manager = DynamicRiskManager(stop_loss_pct=0.05, take_profit_pct=0.10)
-        manager.start_position("AAPL", entry_price=100.0, shares=100)
-        manager.start_position("MSFT", entry_price=200.0, shares=50)
-        manager.start_position("GOOGL", entry_price=150.0, shares=75)
+        manager.start_positions(
+            ["AAPL", "MSFT", "GOOGL"],
+            entry_prices=np.array([100.0, 200.0, 150.0]),
+            shares=np.array([100, 50, 75]),
+        )
 
         # AAPL hits stop-loss, MSFT hits take-profit, GOOGL is safe
         manager.update_prices({"AAPL": 94.0, "MSFT": 222.0, "GOOGL": 155.0})
@@ -196,50 +252,30 @@ class TestDynamicRiskManagerPortfolioMonitoring:
         metrics = manager.get_portfolio_metrics()
         assert metrics["daily_start_value"] == 105000.0
 
-    def test_check_circuit_breaker_daily_loss(self):
-        """Test circuit breaker on daily loss limit."""
-        manager = DynamicRiskManager(
-            initial_portfolio_value=100000.0,
-            daily_loss_limit=0.02,
-        )
-        manager.reset_daily_tracking()
-        manager.update_portfolio_value(97500.0)  # -2.5% daily loss
-
-        triggered = manager.check_circuit_breaker()
-
-        assert triggered
-        assert manager.is_circuit_breaker_active()
-        assert "daily loss" in manager.get_circuit_breaker_reason().lower()
-
-    def test_check_circuit_breaker_max_drawdown(self):
-        """Test circuit breaker on max drawdown."""
-        manager = DynamicRiskManager(
-            initial_portfolio_value=100000.0,
-            max_drawdown=0.05,
-        )
-        manager.update_portfolio_value(110000.0)  # New peak
-        manager.update_portfolio_value(104000.0)  # -5.45% from peak
-
-        triggered = manager.check_circuit_breaker()
-
-        assert triggered
-        assert manager.is_circuit_breaker_active()
-        assert "drawdown" in manager.get_circuit_breaker_reason().lower()
-
-    def test_check_circuit_breaker_no_trigger(self):
-        """Test circuit breaker doesn't trigger within limits."""
-        manager = DynamicRiskManager(
-            initial_portfolio_value=100000.0,
-            daily_loss_limit=0.02,
-            max_drawdown=0.05,
-        )
+    @pytest.mark.parametrize(
+        "values,thresholds,expect_triggered,reason",
+        [
+            ([97500.0], {"daily_loss_limit": 0.02}, True, "daily loss"),  # -2.5% daily loss
+            ([110000.0, 104000.0], {"max_drawdown": 0.05}, True, "drawdown"),  # -5.45% from peak
+            ([98500.0], {"daily_loss_limit": 0.02, "max_drawdown": 0.05}, False, None),  # -1.5%
+        ],
+        ids=["daily_loss", "max_drawdown", "no_trigger"],
+    )
+    def test_check_circuit_breaker(
+        self, values, thresholds, expect_triggered, reason
+    ):
+        """Test circuit breaker triggers on daily loss or drawdown, and not within limits."""
+        manager = DynamicRiskManager(initial_portfolio_value=100000.0, **thresholds)
         manager.reset_daily_tracking()
-        manager.update_portfolio_value(98500.0)  # -1.5% (within limit)
+        for value in values:
+            manager.update_portfolio_value(value)
 
         triggered = manager.check_circuit_breaker()
 
-        assert not triggered
-        assert not manager.is_circuit_breaker_active()
+        assert triggered is expect_triggered
+        assert manager.is_circuit_breaker_active() is expect_triggered
+        if reason is not None:
+            assert reason in manager.get_circuit_breaker_reason().lower()
 
     def test_get_portfolio_metrics(self):
         """Test getting comprehensive portfolio metrics."""
@@ -256,75 +292,66 @@ class TestDynamicRiskManagerPortfolioMonitoring:
         assert metrics["daily_pnl_pct"] == pytest.approx(0.02)
 
 
-class TestDynamicRiskManagerPositionSync:
-    """Tests for position synchronization with broker."""
+# Broker-side fields for the symbols used in the sync tests
+_SYNC_POSITIONS = {
+    "AAPL": {"shares": 100, "avg_cost": 150.0, "market_value": 15500.0},
+    "MSFT": {"shares": 50, "avg_cost": 300.0, "market_value": 15250.0},
+}
 
-    def test_sync_positions_add_new(self):
-        """Test syncing adds new positions."""
-        manager = DynamicRiskManager()
 
-        positions = [
-            Position(
-                symbol="AAPL",
-                shares=100,
-                avg_cost=150.0,
-                market_value=15500.0,
-            ),
-            Position(
-                symbol="MSFT",
-                shares=50,
-                avg_cost=300.0,
-                market_value=15250.0,
-            ),
-        ]
+@pytest.fixture
+def make_position():
+    """Build a broker Position for one of the sync-test symbols."""
 
-        manager.sync_positions(positions)
+    def _make(symbol: str) -> Position:
+        return Position(symbol=symbol, **_SYNC_POSITIONS[symbol])
 
-        risks = manager.get_position_risks()
-        assert len(risks) == 2
-        symbols = {risk.symbol for risk in risks}
-        assert symbols == {"AAPL", "MSFT"}
+    return _make
 
-    def test_sync_positions_remove_closed(self):
-        """Test syncing removes closed positions."""
-        manager = DynamicRiskManager()
-        manager.start_position("AAPL", entry_price=150.0, shares=100)
-        manager.start_position("MSFT", entry_price=300.0, shares=50)
 
-        # Only AAPL position remains
-        positions = [
-            Position(
-                symbol="AAPL",
-                shares=100,
-                avg_cost=150.0,
-                market_value=15500.0,
-            ),
-        ]
+class TestDynamicRiskManagerPositionSync:
+    """Tests for position synchronization with broker."""
 
-        manager.sync_positions(positions)
+    @pytest.mark.parametrize(
+        "pre,synced,expected",
+        [
+            ((), ("AAPL", "MSFT"), {"AAPL", "MSFT"}),
+            (("AAPL", "MSFT"), ("AAPL",), {"AAPL"}),
+            (("AAPL",), ("AAPL",), {"AAPL"}),
+        ],
+        ids=["add_new", "remove_closed", "no_duplicates"],
+    )
+    def test_sync_positions(self, make_position, pre, synced, expected):
+        """Test syncing adds new, removes closed and keeps existing positions once."""
+        manager = DynamicRiskManager()
+        for symbol in pre:
+            fields = _SYNC_POSITIONS[symbol]
+            manager.start_position(symbol, entry_price=fields["avg_cost"], shares=fields["shares"])
+
+        manager.sync_positions([make_position(symbol) for symbol in synced])
 
         risks = manager.get_position_risks()
-        assert len(risks) == 1
-        assert risks[0].symbol == "AAPL"
+        assert len(risks) == len(expected)
+        assert {risk.symbol for risk in risks} == expected
 
-    def test_sync_positions_no_duplicates(self):
-        """Test syncing doesn't duplicate existing positions."""
+    def test_sync_positions_large_book(self):
+        """Test syncing a 1000-position book adds and drops the right symbols."""
         manager = DynamicRiskManager()
-        manager.start_position("AAPL", entry_price=150.0, shares=100)
+        manager.start_positions(
+            [f"OLD{i}" for i in range(500)], np.full(500, 10.0), np.full(500, 1)
+        )
+        manager.start_positions(
+            [f"SYM{i}" for i in range(500)], np.full(500, 20.0), np.full(500, 2)
+        )
 
-        positions = [
-            Position(
-                symbol="AAPL",
-                shares=100,
-                avg_cost=150.0,
-                market_value=15500.0,
-            ),
+        held = [
+            Position(symbol=f"SYM{i}", shares=2, avg_cost=20.0, market_value=40.0)
+            for i in range(1000)
         ]
-
-        manager.sync_positions(positions)
+        manager.sync_positions(held)
 
         risks = manager.get_position_risks()
-        assert len(risks) == 1
+        assert {risk.symbol for risk in risks} == {f"SYM{i}" for i in range(1000)}
 
 
 class TestDynamicRiskManagerSummary:
@@ -367,6 +394,42 @@ class TestDynamicRiskManagerSummary:
         assert summary["circuit_breaker_reason"] is not None
         assert "daily loss" in summary["circuit_breaker_reason"].lower()
 
+    def test_get_summary_cached_until_state_changes(self):
+        """Test repeated reports are reused and invalidated by mutators."""
+        manager = DynamicRiskManager(initial_portfolio_value=100000.0)
+        manager.start_position("AAPL", entry_price=150.0, shares=100)
+
+        get_metrics = Mock(wraps=manager._portfolio_monitor.get_metrics)
+        manager._portfolio_monitor.get_metrics = get_metrics
+
+        summary = manager.get_summary()
+        metrics = manager.get_portfolio_metrics()
+        assert manager.get_summary() == summary
+        assert manager.get_portfolio_metrics() == metrics
+        assert get_metrics.call_count == 1
+
+        manager.update_portfolio_value(101000.0)
+        assert manager.get_portfolio_metrics()["portfolio_value"] == 101000.0
+        assert manager.get_summary()["portfolio_value"] == 101000.0
+
+        manager.close_position("AAPL")
+        assert manager.get_summary()["positions_tracked"] == 0
+
+    def test_cached_reports_are_copies(self):
+        """Test editing a returned report does not leak into later calls."""
+        manager = DynamicRiskManager(initial_portfolio_value=100000.0)
+
+        summary = manager.get_summary()
+        summary["extra"] = 1
+        summary["thresholds"]["stop_loss_pct"] = 0.5
+        metrics = manager.get_portfolio_metrics()
+        metrics["portfolio_value"] = 0.0
+
+        assert "extra" not in manager.get_summary()
+        thresholds = manager.get_summary()["thresholds"]
+        assert thresholds["stop_loss_pct"] == manager.stop_loss_pct
+        assert manager.get_portfolio_metrics()["portfolio_value"] == 100000.0
+
 
 class TestDynamicRiskManagerIntegration:
     """Integration tests combining multiple features."""
@@ -387,8 +450,9 @@ class TestDynamicRiskManagerIntegration:
         assert result.is_compliant
 
         # Start tracking positions
-        manager.start_position("AAPL", entry_price=150.0, shares=100)
-        manager.start_position("MSFT", entry_price=300.0, shares=33)
+        manager.start_positions(
+            ["AAPL", "MSFT"], entry_prices=np.array([150.0, 300.0]), shares=np.array([100, 33])
+        )
 
         # Initialize daily tracking
         manager.reset_daily_tracking()
@@ -433,3 +497,25 @@ class TestDynamicRiskManagerIntegration:
         # Trading should be halted
         summary = manager.get_summary()
         assert summary["circuit_breaker_active"]
+
+    def test_replay_portfolio_values_long_series(self):
+        """Test vectorized circuit-breaker replay over a 10k-point series."""
+        manager = DynamicRiskManager(
+            initial_portfolio_value=100000.0,
+            daily_loss_limit=0.02,
+            max_drawdown=0.05,
+        )
+        # Steady climb to 110k, then a slide past the 5% drawdown limit
+        values = np.concatenate(
+            [np.linspace(100000.0, 110000.0, 5000), np.linspace(110000.0, 103000.0, 5000)]
+        )
+
+        triggered = manager.replay_portfolio_values(values)
+
+        assert triggered.shape == values.shape
+        first = int(np.argmax(triggered))
+        assert not triggered[:first].any()
+        assert values[first] <= 110000.0 * 0.95
+        assert triggered[first:].all()
+        # Replay does not touch live state
+        assert not manager.is_circuit_breaker_active()
@@ -1,5 +1,7 @@
 """Unit tests for custom exceptions."""
 
+import re
+
 import pytest
 
 from src.utils.exceptions import (
@@ -11,85 +13,72 @@ from src.utils.exceptions import (
     StorageError,
 )
 
+# (child, parent) pairs that make up the exception hierarchy
+EXC_HIERARCHY = [
+    (ConfigurationError, AITraderError),
+    (DataError, AITraderError),
+    (DataProviderError, DataError),
+    (DataProviderError, AITraderError),
+    (DataQualityError, DataError),
+    (DataQualityError, AITraderError),
+    (StorageError, DataError),
+    (StorageError, AITraderError),
+]
+
+# (exception class, message) pairs raised and matched in TestExceptionRaising
+EXC_MESSAGES = [
+    (AITraderError, "Base error"),
+    (ConfigurationError, "Config missing"),
+    (DataError, "Data error occurred"),
+    (DataProviderError, "API failed"),
+    (DataQualityError, "Invalid data"),
+    (StorageError, "Database failed"),
+]
+
+# Literal-match patterns compiled once at import, keyed by message
+_PATTERNS = {msg: re.compile(re.escape(msg)) for _, msg in EXC_MESSAGES}
+
+
+def _exc_id(value: object) -> str | None:
+    """Use class names as readable parametrize ids."""
+    return value.__name__ if isinstance(value, type) else None
+
 
 class TestExceptionHierarchy:
     """Test exception inheritance hierarchy."""
 
-    def test_configuration_error_inherits_from_aitrader_error(self) -> None:
-        """Test ConfigurationError is a subclass of AITraderError."""
-        assert issubclass(ConfigurationError, AITraderError)
-
-    def test_data_error_inherits_from_aitrader_error(self) -> None:
-        """Test DataError is a subclass of AITraderError."""
-        assert issubclass(DataError, AITraderError)
-
-    def test_data_provider_error_inherits_from_data_error(self) -> None:
-        """Test DataProviderError is a subclass of DataError."""
-        assert issubclass(DataProviderError, DataError)
-        assert issubclass(DataProviderError, AITraderError)
-
-    def test_data_quality_error_inherits_from_data_error(self) -> None:
-        """Test DataQualityError is a subclass of DataError."""
-        assert issubclass(DataQualityError, DataError)
-        assert issubclass(DataQualityError, AITraderError)
-
-    def test_storage_error_inherits_from_data_error(self) -> None:
-        """Test StorageError is a subclass of DataError."""
-        assert issubclass(StorageError, DataError)
-        assert issubclass(StorageError, AITraderError)
+    @pytest.mark.parametrize("child,parent", EXC_HIERARCHY, ids=_exc_id)
+    def test_inherits(self, child: type, parent: type) -> None:
+        """Test each exception is a subclass of its parent."""
+        assert issubclass(child, parent)
 
 
 class TestExceptionRaising:
     """Test raising and catching exceptions."""
 
-    def test_raise_aitrader_error(self) -> None:
-        """Test raising and catching AITraderError."""
-        with pytest.raises(AITraderError, match="Base error"):
-            raise AITraderError("Base error")
-
-    def test_raise_configuration_error(self) -> None:
-        """Test raising and catching ConfigurationError."""
-        with pytest.raises(ConfigurationError, match="Config missing"):
-            raise ConfigurationError("Config missing")
-
-    def test_raise_data_error(self) -> None:
-        """Test raising and catching DataError."""
-        with pytest.raises(DataError, match="Data error occurred"):
-            raise DataError("Data error occurred")
-
-    def test_raise_data_provider_error(self) -> None:
-        """Test raising and catching DataProviderError."""
-        with pytest.raises(DataProviderError, match="API failed"):
-            raise DataProviderError("API failed")
-
-    def test_raise_data_quality_error(self) -> None:
-        """Test raising and catching DataQualityError."""
-        with pytest.raises(DataQualityError, match="Invalid data"):
-            raise DataQualityError("Invalid data")
-
-    def test_raise_storage_error(self) -> None:
-        """Test raising and catching StorageError."""
-        with pytest.raises(StorageError, match="Database failed"):
-            raise StorageError("Database failed")
+    @pytest.mark.parametrize("exc_cls,msg", EXC_MESSAGES, ids=_exc_id)
+    def test_raise(self, exc_cls: type, msg: str) -> None:
+        """Test raising and catching each exception with its message."""
+        with pytest.raises(exc_cls, match=_PATTERNS[msg]):
+            raise exc_cls(msg)
 
 
 class TestExceptionCatching:
     """Test catching exceptions at different levels."""
 
-    def test_catch_data_provider_error_as_data_error(self) -> None:
-        """Test DataProviderError can be caught as DataError."""
-        with pytest.raises(DataError):
-            raise DataProviderError("API failed")
-
-    def test_catch_data_provider_error_as_aitrader_error(self) -> None:
-        """Test DataProviderError can be caught as AITraderError."""
-        with pytest.raises(AITraderError):
-            raise DataProviderError("API failed")
-
-    def test_catch_configuration_error_as_aitrader_error(self) -> None:
-        """Test ConfigurationError can be caught as AITraderError."""
-        with pytest.raises(AITraderError):
-            raise ConfigurationError("Config missing")
+    @pytest.mark.parametrize(
+        "exc_cls,catch_as,msg",
+        [
+            (DataProviderError, DataError, "API failed"),
+            (DataProviderError, AITraderError, "API failed"),
+            (ConfigurationError, AITraderError, "Config missing"),
+        ],
+        ids=["provider_as_data", "provider_as_base", "config_as_base"],
+    )
+    def test_catch_as_parent(self, exc_cls: type, catch_as: type, msg: str) -> None:
+        """Test a subclass exception can be caught as its parent."""
+        with pytest.raises(catch_as):
+            raise exc_cls(msg)
 
     def test_catch_specific_exception(self) -> None:
         """Test catching specific exception type."""
@@ -112,26 +101,21 @@ class TestExceptionCatching:
 class TestExceptionInheritance:
     """Test exception isinstance checks."""
 
-    def test_data_provider_error_isinstance_checks(self) -> None:
-        """Test isinstance for DataProviderError."""
-        error = DataProviderError("test")
-        assert isinstance(error, DataProviderError)
-        assert isinstance(error, DataError)
-        assert isinstance(error, AITraderError)
-        assert isinstance(error, Exception)
-
-    def test_configuration_error_isinstance_checks(self) -> None:
-        """Test isinstance for ConfigurationError."""
-        error = ConfigurationError("test")
-        assert isinstance(error, ConfigurationError)
-        assert isinstance(error, AITraderError)
-        assert isinstance(error, Exception)
-        assert not isinstance(error, DataError)
-
-    def test_storage_error_isinstance_checks(self) -> None:
-        """Test isinstance for StorageError."""
-        error = StorageError("test")
-        assert isinstance(error, StorageError)
-        assert isinstance(error, DataError)
-        assert isinstance(error, AITraderError)
-        assert not isinstance(error, ConfigurationError)
+    @pytest.mark.parametrize(
+        "exc_cls,positive_bases,negative_bases",
+        [
+            (DataProviderError, (DataProviderError, DataError, AITraderError, Exception), ()),
+            (ConfigurationError, (ConfigurationError, AITraderError, Exception), (DataError,)),
+            (StorageError, (StorageError, DataError, AITraderError), (ConfigurationError,)),
+        ],
+        ids=["data_provider", "configuration", "storage"],
+    )
+    def test_isinstance_checks(
+        self, exc_cls: type, positive_bases: tuple, negative_bases: tuple
+    ) -> None:
+        """Test isinstance against expected and unrelated bases."""
+        error = exc_cls("test")
+        for base in positive_bases:
+            assert isinstance(error, base)
+        for base in negative_bases:
+            assert not isinstance(error, base)
@@ -1,12 +1,45 @@
 """Unit tests for ExecutionAPI."""
 
 from datetime import datetime
+from operator import itemgetter
+from types import MappingProxyType
 
 import pytest
 
 from src.api.execution_api import ExecutionAPI
 from src.portfolio.base import Order, OrderAction
 
+# Keep the module on one worker so shared_api is built once under --dist loadgroup
+pytestmark = pytest.mark.xdist_group(name="execution_api")
+
+# Read-only price maps; set_prices() copies its argument
+_PRICES = MappingProxyType({"AAPL": 150.0, "MSFT": 350.0})
+_AAPL_ONLY = MappingProxyType({"AAPL": 150.0})
+
+# (cash, portfolio_value, positions_value) from get_account_info()
+_ACCOUNT_FIELDS = itemgetter("cash", "portfolio_value", "positions_value")
+# (symbol, shares, price, value) from a get_fills() entry
+_FILL_FIELDS = itemgetter("symbol", "shares", "price", "value")
+
+# Simulation clock for the timestamp test and its expected fill string
+_TEST_TIME = datetime(2024, 6, 15, 10, 30, 0)
+_TEST_TIME_ISO = _TEST_TIME.isoformat()
+
+
+@pytest.fixture(scope="module")
+def shared_api() -> ExecutionAPI:
+    """Build one zero-slippage API per module; per-class fixtures reset it."""
+    return ExecutionAPI(initial_cash=100000.0, slippage_pct=0.0)
+
+
+@pytest.fixture(scope="session")
+def buy_orders() -> tuple:
+    """AAPL and MSFT buy Orders built once; executors only read them."""
+    return (
+        Order(action=OrderAction.BUY, symbol="AAPL", shares=50, estimated_value=7500.0),
+        Order(action=OrderAction.BUY, symbol="MSFT", shares=20, estimated_value=7000.0),
+    )
+
 
 class TestExecutionAPIInit:
     """Test cases for ExecutionAPI initialization."""
@@ -41,99 +74,83 @@ class TestBuyAndSell:
     """Test cases for buy and sell operations."""
 
     @pytest.fixture
-    def api(self) -> ExecutionAPI:
-        """Create API with test configuration."""
-        api = ExecutionAPI(initial_cash=100000.0, slippage_pct=0.0)
-        api.set_prices({"AAPL": 150.0, "MSFT": 350.0})
-        return api
-
-    def test_buy_order(self, api: ExecutionAPI) -> None:
-        """Test successful buy order."""
-        result = api.buy("AAPL", 100)
+    def api(self, shared_api: ExecutionAPI) -> ExecutionAPI:
+        """Reset the shared API and load this class's test prices."""
+        shared_api.reset()
+        shared_api.set_prices(_PRICES)
+        return shared_api
+
+    @pytest.mark.parametrize(
+        "ops,expected_action,expected_qty",
+        [
+            ([("buy", "AAPL", 100)], "BUY", 100),
+            ([("buy", "AAPL", 100), ("sell", "AAPL", 50)], "SELL", 50),
+        ],
+        ids=["buy", "buy_then_sell"],
+    )
+    def test_filled_orders(
+        self, api: ExecutionAPI, ops: list, expected_action: str, expected_qty: int
+    ) -> None:
+        """Test buy and sell orders fill with an auto-estimated value."""
+        # Bind the order methods once rather than per op
+        dispatch = {"buy": api.buy, "sell": api.sell}
+        for method, symbol, shares in ops:
+            result = dispatch[method](symbol, shares)
 
         assert result["status"] == "filled"
         assert result["symbol"] == "AAPL"
-        assert result["action"] == "BUY"
-        assert result["filled_qty"] == 100
+        assert result["action"] == expected_action
+        assert result["filled_qty"] == expected_qty
         assert result["filled_price"] == 150.0
 
-    def test_sell_order(self, api: ExecutionAPI) -> None:
-        """Test successful sell order."""
-        # First buy
-        api.buy("AAPL", 100)
-
-        # Then sell
-        result = api.sell("AAPL", 50)
-
-        assert result["status"] == "filled"
-        assert result["action"] == "SELL"
-        assert result["filled_qty"] == 50
-
-    def test_buy_rejected_insufficient_funds(self, api: ExecutionAPI) -> None:
-        """Test buy order rejected when insufficient funds."""
-        result = api.buy("AAPL", 1000)  # Would cost $150,000
-
-        assert result["status"] == "rejected"
-        assert "Insufficient funds" in result["rejected_reason"]
-
-    def test_sell_rejected_no_position(self, api: ExecutionAPI) -> None:
-        """Test sell order rejected when no position."""
-        result = api.sell("AAPL", 100)
-
-        assert result["status"] == "rejected"
-        assert "Insufficient shares" in result["rejected_reason"]
-
-    def test_buy_rejected_no_price(self, api: ExecutionAPI) -> None:
-        """Test buy order rejected when no price available."""
-        result = api.buy("UNKNOWN", 100)
+    @pytest.mark.parametrize(
+        "method,symbol,shares,reason",
+        [
+            ("buy", "AAPL", 1000, "Insufficient funds"),  # Would cost $150,000
+            ("sell", "AAPL", 100, "Insufficient shares"),
+            ("buy", "UNKNOWN", 100, "No price available"),
+        ],
+        ids=["insufficient_funds", "no_position", "no_price"],
+    )
+    def test_rejected_orders(
+        self, api: ExecutionAPI, method: str, symbol: str, shares: int, reason: str
+    ) -> None:
+        """Test orders are rejected with a reason when they cannot fill."""
+        result = getattr(api, method)(symbol, shares)
 
         assert result["status"] == "rejected"
-        assert "No price available" in result["rejected_reason"]
-
-    def test_buy_auto_estimate_value(self, api: ExecutionAPI) -> None:
-        """Test buy with auto-calculated estimated value."""
-        result = api.buy("AAPL", 100)
-        assert result["status"] == "filled"
-
-    def test_sell_auto_estimate_value(self, api: ExecutionAPI) -> None:
-        """Test sell with auto-calculated estimated value."""
-        api.buy("AAPL", 100)
-        result = api.sell("AAPL", 50)
-        assert result["status"] == "filled"
+        assert reason in result["rejected_reason"]
 
 
 class TestExecuteOrders:
     """Test cases for execute_orders method."""
 
     @pytest.fixture
-    def api(self) -> ExecutionAPI:
-        """Create API with test configuration."""
-        api = ExecutionAPI(initial_cash=100000.0, slippage_pct=0.0)
-        api.set_prices({"AAPL": 150.0, "MSFT": 350.0})
-        return api
+    def api(self, shared_api: ExecutionAPI) -> ExecutionAPI:
+        """Reset the shared API and load this class's test prices."""
+        shared_api.reset()
+        shared_api.set_prices(_PRICES)
+        return shared_api
 
-    def test_execute_multiple_orders(self, api: ExecutionAPI) -> None:
+    def test_execute_multiple_orders(self, api: ExecutionAPI, buy_orders: tuple) -> None:
         """Test executing multiple orders."""
-        orders = [
-            Order(action=OrderAction.BUY, symbol="AAPL", shares=50, estimated_value=7500.0),
-            Order(action=OrderAction.BUY, symbol="MSFT", shares=20, estimated_value=7000.0),
-        ]
+        orders = list(buy_orders)
 
         results = api.execute_orders(orders)
 
-        assert len(results) == 2
-        assert all(r["status"] == "filled" for r in results)
+        statuses = [r["status"] for r in results]
+        assert statuses == ["filled"] * len(orders)
 
 
 class TestPositions:
     """Test cases for position management."""
 
     @pytest.fixture
-    def api(self) -> ExecutionAPI:
-        """Create API with test configuration."""
-        api = ExecutionAPI(initial_cash=100000.0, slippage_pct=0.0)
-        api.set_prices({"AAPL": 150.0, "MSFT": 350.0})
-        return api
+    def api(self, shared_api: ExecutionAPI) -> ExecutionAPI:
+        """Reset the shared API and load this class's test prices."""
+        shared_api.reset()
+        shared_api.set_prices(_PRICES)
+        return shared_api
 
     def test_get_position(self, api: ExecutionAPI) -> None:
         """Test getting a specific position."""
@@ -178,19 +195,17 @@ class TestAccountInfo:
     """Test cases for account information."""
 
     @pytest.fixture
-    def api(self) -> ExecutionAPI:
-        """Create API with test configuration."""
-        api = ExecutionAPI(initial_cash=100000.0, slippage_pct=0.0)
-        api.set_prices({"AAPL": 150.0})
-        return api
+    def api(self, shared_api: ExecutionAPI) -> ExecutionAPI:
+        """Reset the shared API and load this class's test prices."""
+        shared_api.reset()
+        shared_api.set_prices(_AAPL_ONLY)
+        return shared_api
 
     def test_get_account_info(self, api: ExecutionAPI) -> None:
         """Test getting account info."""
         account = api.get_account_info()
 
-        assert account["cash"] == 100000.0
-        assert account["portfolio_value"] == 100000.0
-        assert account["positions_value"] == 0.0
+        assert _ACCOUNT_FIELDS(account) == (100000.0, 100000.0, 0.0)
 
     def test_account_after_buy(self, api: ExecutionAPI) -> None:
         """Test account info after buying."""
@@ -198,9 +213,8 @@ class TestAccountInfo:
 
         account = api.get_account_info()
 
-        assert account["cash"] == 85000.0  # 100000 - 15000
-        assert account["positions_value"] == 15000.0
-        assert account["portfolio_value"] == 100000.0
+        # Cash is 100000 - 15000; portfolio value is unchanged
+        assert _ACCOUNT_FIELDS(account) == (85000.0, 100000.0, 15000.0)
 
     def test_cash_property(self, api: ExecutionAPI) -> None:
         """Test cash property."""
@@ -221,11 +235,11 @@ class TestFills:
     """Test cases for fill tracking."""
 
     @pytest.fixture
-    def api(self) -> ExecutionAPI:
-        """Create API with test configuration."""
-        api = ExecutionAPI(initial_cash=100000.0, slippage_pct=0.0)
-        api.set_prices({"AAPL": 150.0})
-        return api
+    def api(self, shared_api: ExecutionAPI) -> ExecutionAPI:
+        """Reset the shared API and load this class's test prices."""
+        shared_api.reset()
+        shared_api.set_prices(_AAPL_ONLY)
+        return shared_api
 
     def test_get_fills(self, api: ExecutionAPI) -> None:
         """Test getting fills."""
@@ -234,21 +248,18 @@ class TestFills:
         fills = api.get_fills()
 
         assert len(fills) == 1
-        assert fills[0]["symbol"] == "AAPL"
-        assert fills[0]["shares"] == 100
-        assert fills[0]["price"] == 150.0
-        assert fills[0]["value"] == 15000.0
+        assert _FILL_FIELDS(fills[0]) == ("AAPL", 100, 150.0, 15000.0)
 
 
 class TestPerformance:
     """Test cases for performance tracking."""
 
     @pytest.fixture
-    def api(self) -> ExecutionAPI:
-        """Create API with test configuration."""
-        api = ExecutionAPI(initial_cash=100000.0, slippage_pct=0.0)
-        api.set_prices({"AAPL": 100.0})
-        return api
+    def api(self, shared_api: ExecutionAPI) -> ExecutionAPI:
+        """Reset the shared API and load this class's test prices."""
+        shared_api.reset()
+        shared_api.set_prices({"AAPL": 100.0})
+        return shared_api
 
     def test_get_performance_summary(self, api: ExecutionAPI) -> None:
         """Test getting performance summary."""
@@ -257,10 +268,9 @@ class TestPerformance:
 
         summary = api.get_performance_summary()
 
-        assert summary["initial_cash"] == 100000.0
-        assert summary["final_value"] == 101000.0  # 90000 cash + 11000 position
-        assert summary["total_return"] == 0.01
-        assert summary["num_trades"] == 1
+        # Final value is 90000 cash + 11000 position
+        fields = itemgetter("initial_cash", "final_value", "total_return", "num_trades")(summary)
+        assert fields == pytest.approx((100000.0, 101000.0, 0.01, 1))
 
     def test_format_performance_summary(self, api: ExecutionAPI) -> None:
         """Test formatted performance summary."""
@@ -268,27 +278,28 @@ class TestPerformance:
 
         output = api.format_performance_summary()
 
-        assert "PERFORMANCE SUMMARY" in output
-        assert "Initial Cash" in output
-        assert "Total Return" in output
+        needles = ("PERFORMANCE SUMMARY", "Initial Cash", "Total Return")
+        missing = [needle for needle in needles if needle not in output]
+        assert not missing, missing
 
 
 class TestPortfolioSummary:
     """Test cases for portfolio summary."""
 
     @pytest.fixture
-    def api(self) -> ExecutionAPI:
-        """Create API with test configuration."""
-        api = ExecutionAPI(initial_cash=100000.0, slippage_pct=0.0)
-        api.set_prices({"AAPL": 150.0, "MSFT": 350.0})
-        return api
+    def api(self, shared_api: ExecutionAPI) -> ExecutionAPI:
+        """Reset the shared API and load this class's test prices."""
+        shared_api.reset()
+        shared_api.set_prices(_PRICES)
+        return shared_api
 
     def test_get_portfolio_summary_no_positions(self, api: ExecutionAPI) -> None:
         """Test portfolio summary with no positions."""
         output = api.get_portfolio_summary()
 
-        assert "PORTFOLIO SUMMARY" in output
-        assert "No positions" in output
+        needles = ("PORTFOLIO SUMMARY", "No positions")
+        missing = [needle for needle in needles if needle not in output]
+        assert not missing, missing
 
     def test_get_portfolio_summary_with_positions(self, api: ExecutionAPI) -> None:
         """Test portfolio summary with positions."""
@@ -297,10 +308,9 @@ class TestPortfolioSummary:
 
         output = api.get_portfolio_summary()
 
-        assert "PORTFOLIO SUMMARY" in output
-        assert "POSITIONS" in output
-        assert "AAPL" in output
-        assert "MSFT" in output
+        needles = ("PORTFOLIO SUMMARY", "POSITIONS", "AAPL", "MSFT")
+        missing = [needle for needle in needles if needle not in output]
+        assert not missing, missing
 
 
 class TestTimestamp:
@@ -309,34 +319,35 @@ class TestTimestamp:
     def test_set_timestamp(self) -> None:
         """Test setting simulation timestamp."""
         api = ExecutionAPI(initial_cash=100000.0)
-        api.set_prices({"AAPL": 150.0})
+        api.set_prices(_AAPL_ONLY)
 
-        test_time = datetime(2024, 6, 15, 10, 30, 0)
-        api.set_timestamp(test_time)
+        api.set_timestamp(_TEST_TIME)
 
         api.buy("AAPL", 100)
         fills = api.get_fills()
 
-        assert fills[0]["timestamp"] == test_time.isoformat()
+        assert fills[0]["timestamp"] == _TEST_TIME_ISO
 
 
 class TestReset:
     """Test cases for reset functionality."""
 
-    def test_reset(self) -> None:
+    @pytest.fixture
+    def dirty_api(self, shared_api: ExecutionAPI) -> ExecutionAPI:
+        """Return the shared API after a filled AAPL buy."""
+        shared_api.reset()
+        shared_api.set_prices(_AAPL_ONLY)
+        shared_api.buy("AAPL", 100)
+        return shared_api
+
+    def test_reset(self, dirty_api: ExecutionAPI) -> None:
         """Test resetting to initial state."""
-        api = ExecutionAPI(initial_cash=100000.0, slippage_pct=0.0)
-        api.set_prices({"AAPL": 150.0})
-
-        # Execute some trades
-        api.buy("AAPL", 100)
-        assert api.cash < 100000.0
-        assert len(api.get_all_positions()) > 0
+        assert dirty_api.cash < 100000.0
+        assert len(dirty_api.get_all_positions()) > 0
 
-        # Reset
-        api.reset()
+        dirty_api.reset()
 
         # Verify initial state
-        assert api.cash == 100000.0
-        assert len(api.get_all_positions()) == 0
-        assert len(api.get_fills()) == 0
+        assert dirty_api.cash == 100000.0
+        assert len(dirty_api.get_all_positions()) == 0
+        assert len(dirty_api.get_fills()) == 0
@@ -16,56 +16,82 @@ from src.execution.base import (
 )
 from src.portfolio.base import Order, OrderAction
 
+# Keep the module on one worker so shared fixtures are built once under --dist loadgroup
+pytestmark = pytest.mark.xdist_group(name="execution_base")
+
 
 class TestOrderStatus:
     """Test cases for OrderStatus enum."""
 
-    def test_status_values(self) -> None:
+    @pytest.mark.parametrize(
+        "member,value",
+        [
+            (OrderStatus.PENDING, "pending"),
+            (OrderStatus.SUBMITTED, "submitted"),
+            (OrderStatus.PARTIALLY_FILLED, "partially_filled"),
+            (OrderStatus.FILLED, "filled"),
+            (OrderStatus.REJECTED, "rejected"),
+            (OrderStatus.CANCELLED, "cancelled"),
+            (OrderStatus.EXPIRED, "expired"),
+        ],
+    )
+    def test_status_value(self, member: OrderStatus, value: str) -> None:
         """Test OrderStatus enum values."""
-        assert OrderStatus.PENDING.value == "pending"
-        assert OrderStatus.SUBMITTED.value == "submitted"
-        assert OrderStatus.PARTIALLY_FILLED.value == "partially_filled"
-        assert OrderStatus.FILLED.value == "filled"
-        assert OrderStatus.REJECTED.value == "rejected"
-        assert OrderStatus.CANCELLED.value == "cancelled"
-        assert OrderStatus.EXPIRED.value == "expired"
+        assert member.value == value
 
 
 class TestOrderType:
     """Test cases for OrderType enum."""
 
-    def test_order_type_values(self) -> None:
+    @pytest.mark.parametrize(
+        "member,value",
+        [
+            (OrderType.MARKET, "market"),
+            (OrderType.LIMIT, "limit"),
+            (OrderType.STOP, "stop"),
+            (OrderType.STOP_LIMIT, "stop_limit"),
+        ],
+    )
+    def test_order_type_value(self, member: OrderType, value: str) -> None:
         """Test OrderType enum values."""
-        assert OrderType.MARKET.value == "market"
-        assert OrderType.LIMIT.value == "limit"
-        assert OrderType.STOP.value == "stop"
-        assert OrderType.STOP_LIMIT.value == "stop_limit"
+        assert member.value == value
 
 
 class TestTimeInForce:
     """Test cases for TimeInForce enum."""
 
-    def test_time_in_force_values(self) -> None:
+    @pytest.mark.parametrize(
+        "member,value",
+        [
+            (TimeInForce.DAY, "day"),
+            (TimeInForce.GTC, "gtc"),
+            (TimeInForce.IOC, "ioc"),
+            (TimeInForce.FOK, "fok"),
+        ],
+    )
+    def test_time_in_force_value(self, member: TimeInForce, value: str) -> None:
         """Test TimeInForce enum values."""
-        assert TimeInForce.DAY.value == "day"
-        assert TimeInForce.GTC.value == "gtc"
-        assert TimeInForce.IOC.value == "ioc"
-        assert TimeInForce.FOK.value == "fok"
+        assert member.value == value
+
+
+@pytest.fixture(scope="session")
+def sample_order() -> Order:
+    """Create the AAPL 100-share buy Order once per session.
+
+    Shared by every test that takes it; executors only read Order fields,
+    so tests must not mutate it.
+    """
+    return Order(
+        action=OrderAction.BUY,
+        symbol="AAPL",
+        shares=100,
+        estimated_value=15000.0,
+    )
 
 
 class TestExecutionOrder:
     """Test cases for ExecutionOrder dataclass."""
 
-    @pytest.fixture
-    def sample_order(self) -> Order:
-        """Create sample Order."""
-        return Order(
-            action=OrderAction.BUY,
-            symbol="AAPL",
-            shares=100,
-            estimated_value=15000.0,
-        )
-
     def test_execution_order_creation(self, sample_order: Order) -> None:
         """Test creating an execution order."""
         exec_order = ExecutionOrder(
@@ -82,29 +108,23 @@ class TestExecutionOrder:
         assert exec_order.filled_qty == 0
         assert exec_order.filled_avg_price == 0.0
 
-    def test_execution_order_is_complete(self, sample_order: Order) -> None:
-        """Test is_complete property for terminal states."""
-        exec_order = ExecutionOrder(order_id="ABC123", order=sample_order)
-
-        # Pending is not complete
-        exec_order.status = OrderStatus.PENDING
-        assert not exec_order.is_complete
-
-        # Submitted is not complete
-        exec_order.status = OrderStatus.SUBMITTED
-        assert not exec_order.is_complete
-
-        # Filled is complete
-        exec_order.status = OrderStatus.FILLED
-        assert exec_order.is_complete
-
-        # Rejected is complete
-        exec_order.status = OrderStatus.REJECTED
-        assert exec_order.is_complete
-
-        # Cancelled is complete
-        exec_order.status = OrderStatus.CANCELLED
-        assert exec_order.is_complete
+    @pytest.mark.parametrize(
+        "status,expected_complete",
+        [
+            (OrderStatus.PENDING, False),
+            (OrderStatus.SUBMITTED, False),
+            (OrderStatus.FILLED, True),
+            (OrderStatus.REJECTED, True),
+            (OrderStatus.CANCELLED, True),
+        ],
+    )
+    def test_execution_order_is_complete(
+        self, sample_order: Order, status: OrderStatus, expected_complete: bool
+    ) -> None:
+        """Test is_complete property is True only for terminal states."""
+        exec_order = ExecutionOrder(order_id="ABC123", order=sample_order, status=status)
+
+        assert exec_order.is_complete is expected_complete
 
     def test_execution_order_remaining_qty(self, sample_order: Order) -> None:
         """Test remaining_qty calculation."""
@@ -211,6 +231,9 @@ class TestAccountInfo:
 class ConcreteExecutor(OrderExecutor):
     """Concrete implementation for testing abstract class."""
 
+    # Order IDs for the first batch positions, built once at class definition
+    _ORDER_IDS = tuple(f"ORDER-{i}" for i in range(1_000))
+
     def __init__(self):
         self._orders = {}
         self._positions = {}
@@ -219,7 +242,7 @@ class ConcreteExecutor(OrderExecutor):
         results = []
         for i, order in enumerate(orders):
             exec_order = ExecutionOrder(
-                order_id=f"ORDER-{i}",
+                order_id=self._ORDER_IDS[i] if i < len(self._ORDER_IDS) else f"ORDER-{i}",
                 order=order,
                 status=OrderStatus.FILLED,
                 filled_qty=order.shares,
@@ -246,6 +269,18 @@ class ConcreteExecutor(OrderExecutor):
         )
 
 
+@pytest.fixture(scope="module")
+def concrete_executor() -> ConcreteExecutor:
+    """Shared executor for tests that do not change its state."""
+    return ConcreteExecutor()
+
+
+@pytest.fixture
+def fresh_executor() -> ConcreteExecutor:
+    """Per-test executor for tests that submit orders or seed positions."""
+    return ConcreteExecutor()
+
+
 class TestOrderExecutorInterface:
     """Test cases for OrderExecutor abstract interface."""
 
@@ -254,26 +289,20 @@ class TestOrderExecutorInterface:
         with pytest.raises(TypeError, match="Can't instantiate abstract class"):
             OrderExecutor()  # type: ignore
 
-    def test_concrete_implementation_works(self) -> None:
+    def test_concrete_implementation_works(self, concrete_executor: ConcreteExecutor) -> None:
         """Test concrete implementation can be instantiated."""
-        executor = ConcreteExecutor()
-        assert isinstance(executor, OrderExecutor)
+        assert isinstance(concrete_executor, OrderExecutor)
 
-    def test_submit_orders(self) -> None:
+    def test_submit_orders(self, fresh_executor: ConcreteExecutor, sample_order: Order) -> None:
         """Test submitting orders."""
-        executor = ConcreteExecutor()
-        orders = [
-            Order(action=OrderAction.BUY, symbol="AAPL", shares=100, estimated_value=15000.0),
-        ]
-
-        results = executor.submit_orders(orders)
+        results = fresh_executor.submit_orders([sample_order])
 
         assert len(results) == 1
         assert results[0].status == OrderStatus.FILLED
 
-    def test_get_position_convenience(self) -> None:
+    def test_get_position_convenience(self, fresh_executor: ConcreteExecutor) -> None:
         """Test get_position convenience method."""
-        executor = ConcreteExecutor()
+        executor = fresh_executor
         executor._positions["AAPL"] = Position(symbol="AAPL", shares=100, avg_cost=150.0)
 
         position = executor.get_position("AAPL")
@@ -1,92 +1,149 @@
 """Unit tests for HeuristicAllocator."""
 
+from types import MappingProxyType
+
 import pytest
 
-from src.portfolio.base import OrderAction, PortfolioState
+from src.portfolio.base import AllocationResult, OrderAction, PortfolioState
 from src.portfolio.heuristic_allocator import HeuristicAllocator
 
+pytestmark = pytest.mark.unit
 
-class TestHeuristicAllocatorConfig:
-    """Test cases for HeuristicAllocator configuration."""
-
-    def test_default_config(self) -> None:
-        """Test allocator with default configuration."""
-        allocator = HeuristicAllocator()
 
-        assert allocator.min_signal_threshold == 0.3
-        assert allocator.max_positions == 10
-        assert allocator.cash_buffer == 0.10
-        assert allocator.max_position_size == 0.20
-        assert allocator.min_trade_value == 100.0
+@pytest.fixture(scope="module")
+def allocator() -> HeuristicAllocator:
+    """Create allocator with test configuration.
 
-    def test_custom_config(self) -> None:
-        """Test allocator with custom configuration."""
-        config = {
+    Built once per module: the allocator keeps no state between calls.
+    """
+    return HeuristicAllocator(
+        {
+            "min_signal_threshold": 0.3,
+            "max_positions": 5,
+            "cash_buffer": 0.10,
+            "max_position_size": 0.25,
+            "min_trade_value": 100.0,
+        }
+    )
+
+
+@pytest.fixture(scope="module")
+def portfolio() -> PortfolioState:
+    """Create test portfolio state (read-only; allocate() does not mutate it)."""
+    return PortfolioState(
+        positions={"MSFT": 10000.0},
+        total_value=100000.0,
+        cash=90000.0,
+        prices={"AAPL": 150.0, "MSFT": 350.0, "GOOGL": 140.0},
+    )
+
+
+@pytest.fixture(scope="module")
+def allocate_result(
+    allocator: HeuristicAllocator, portfolio: PortfolioState
+) -> AllocationResult:
+    """Run the full allocate() pipeline once for the read-only TestAllocate checks.
+
+    GOOGL sits below the 0.3 threshold, so only AAPL and MSFT are allocated.
+    """
+    return allocator.allocate({"AAPL": 0.8, "MSFT": 0.5, "GOOGL": 0.2}, portfolio)
+
+
+def _assert_normalized(weights: dict) -> None:
+    """Assert allocation weights (including Cash) sum to 1.0."""
+    assert sum(weights.values()) == pytest.approx(1.0, abs=1e-3)
+
+
+# 10 signals, all above threshold (twice the fixture's max_positions)
+_MAX_POS_SIGNALS = MappingProxyType({f"STOCK{i}": 0.5 + i * 0.05 for i in range(10)})
+
+# Mixed-strength signals whose top 5 are STRONG2, STRONG1, STRONG3, MID2, MID1
+_RANKED_SIGNALS = MappingProxyType(
+    {
+        "WEAK1": 0.35,
+        "WEAK2": 0.40,
+        "STRONG1": 0.80,
+        "STRONG2": 0.90,
+        "STRONG3": 0.70,
+        "MID1": 0.50,
+        "MID2": 0.55,
+    }
+)
+
+# Read-only generate_orders() inputs shared across TestGenerateOrders
+_NO_POSITIONS = MappingProxyType({})
+_PRICES_AAPL = MappingProxyType({"AAPL": 150.0})
+_TGT_AAPL25 = MappingProxyType({"AAPL": 0.25, "Cash": 0.75})
+
+# (config, expected attributes) for valid configurations
+VALID_CONFIGS = [
+    (
+        None,
+        {
+            "min_signal_threshold": 0.3,
+            "max_positions": 10,
+            "cash_buffer": 0.10,
+            "max_position_size": 0.20,
+            "min_trade_value": 100.0,
+        },
+    ),
+    (
+        {
             "min_signal_threshold": 0.5,
             "max_positions": 5,
             "cash_buffer": 0.20,
             "max_position_size": 0.30,
             "min_trade_value": 500.0,
-        }
-        allocator = HeuristicAllocator(config)
-
-        assert allocator.min_signal_threshold == 0.5
-        assert allocator.max_positions == 5
-        assert allocator.cash_buffer == 0.20
-        assert allocator.max_position_size == 0.30
-        assert allocator.min_trade_value == 500.0
-
-    def test_invalid_min_signal_threshold_negative(self) -> None:
-        """Test config validation for negative min_signal_threshold."""
-        with pytest.raises(ValueError, match="min_signal_threshold must be in"):
-            HeuristicAllocator({"min_signal_threshold": -0.1})
-
-    def test_invalid_min_signal_threshold_above_one(self) -> None:
-        """Test config validation for min_signal_threshold > 1."""
-        with pytest.raises(ValueError, match="min_signal_threshold must be in"):
-            HeuristicAllocator({"min_signal_threshold": 1.5})
+        },
+        None,  # Attributes mirror the config
+    ),
+]
+
+# (config, error message prefix) pairs rejected by config validation
+INVALID_CONFIGS = [
+    ({"min_signal_threshold": -0.1}, "min_signal_threshold must be in"),
+    ({"min_signal_threshold": 1.5}, "min_signal_threshold must be in"),
+    ({"max_positions": 0}, "max_positions must be >= 1"),
+    ({"cash_buffer": -0.1}, "cash_buffer must be in"),
+    ({"cash_buffer": 1.0}, "cash_buffer must be in"),
+    ({"max_position_size": 0}, "max_position_size must be in"),
+    ({"min_trade_value": -100}, "min_trade_value must be >= 0"),
+]
 
-    def test_invalid_max_positions(self) -> None:
-        """Test config validation for max_positions < 1."""
-        with pytest.raises(ValueError, match="max_positions must be >= 1"):
-            HeuristicAllocator({"max_positions": 0})
 
-    def test_invalid_cash_buffer_negative(self) -> None:
-        """Test config validation for negative cash_buffer."""
-        with pytest.raises(ValueError, match="cash_buffer must be in"):
-            HeuristicAllocator({"cash_buffer": -0.1})
-
-    def test_invalid_cash_buffer_one(self) -> None:
-        """Test config validation for cash_buffer = 1."""
-        with pytest.raises(ValueError, match="cash_buffer must be in"):
-            HeuristicAllocator({"cash_buffer": 1.0})
+class TestHeuristicAllocatorConfig:
+    """Test cases for HeuristicAllocator configuration."""
 
-    def test_invalid_max_position_size_zero(self) -> None:
-        """Test config validation for max_position_size = 0."""
-        with pytest.raises(ValueError, match="max_position_size must be in"):
-            HeuristicAllocator({"max_position_size": 0})
+    @pytest.mark.parametrize("config,expected", VALID_CONFIGS, ids=["default", "custom"])
+    def test_valid_config(self, config: dict | None, expected: dict | None) -> None:
+        """Test allocator attributes for default and custom configuration."""
+        allocator = HeuristicAllocator(config)
 
-    def test_invalid_min_trade_value(self) -> None:
-        """Test config validation for negative min_trade_value."""
-        with pytest.raises(ValueError, match="min_trade_value must be >= 0"):
-            HeuristicAllocator({"min_trade_value": -100})
+        for attr, value in (expected or config).items():
+            assert getattr(allocator, attr) == value
+
+    @pytest.mark.parametrize(
+        "config,msg",
+        INVALID_CONFIGS,
+        ids=[
+            "threshold_negative",
+            "threshold_above_one",
+            "max_positions_zero",
+            "cash_buffer_negative",
+            "cash_buffer_one",
+            "max_position_size_zero",
+            "min_trade_value_negative",
+        ],
+    )
+    def test_invalid_config(self, config: dict, msg: str) -> None:
+        """Test config validation rejects out-of-range values."""
+        with pytest.raises(ValueError, match=msg):
+            HeuristicAllocator(config)
 
 
 class TestCalculateTargetWeights:
     """Test cases for calculate_target_weights method."""
 
-    @pytest.fixture
-    def allocator(self) -> HeuristicAllocator:
-        """Create allocator with test configuration."""
-        return HeuristicAllocator(
-            {
-                "min_signal_threshold": 0.3,
-                "max_positions": 5,
-                "cash_buffer": 0.10,
-                "max_position_size": 0.25,
-            }
-        )
-
     def test_no_strong_signals(self, allocator: HeuristicAllocator) -> None:
         """Test 100% cash when no signals above threshold."""
         signals = {"AAPL": 0.2, "MSFT": 0.1, "GOOGL": -0.5}
@@ -112,7 +169,7 @@ class TestCalculateTargetWeights:
         assert "Cash" in weights
         assert weights["AAPL"] <= 0.25  # Capped
         assert weights["Cash"] >= 0.10  # At least cash buffer
-        assert abs(sum(weights.values()) - 1.0) < 0.001
+        _assert_normalized(weights)
 
     def test_multiple_strong_signals(self, allocator: HeuristicAllocator) -> None:
         """Test proportional allocation with multiple signals."""
@@ -126,13 +183,11 @@ class TestCalculateTargetWeights:
         # When both get capped at max_position_size, they may be equal
         # AAPL should get >= MSFT (stronger signal, but may be capped)
         assert weights["AAPL"] >= weights["MSFT"]
-        assert abs(sum(weights.values()) - 1.0) < 0.001
+        _assert_normalized(weights)
 
     def test_max_positions_limit(self, allocator: HeuristicAllocator) -> None:
         """Test max_positions limit is enforced."""
-        # Create 10 signals, all above threshold
-        signals = {f"STOCK{i}": 0.5 + i * 0.05 for i in range(10)}
-        weights = allocator.calculate_target_weights(signals)
+        weights = allocator.calculate_target_weights(_MAX_POS_SIGNALS)
 
         # Should only have max_positions (5) + Cash
         equity_positions = [k for k in weights.keys() if k != "Cash"]
@@ -140,16 +195,7 @@ class TestCalculateTargetWeights:
 
     def test_top_signals_selected(self, allocator: HeuristicAllocator) -> None:
         """Test that strongest signals are selected."""
-        signals = {
-            "WEAK1": 0.35,
-            "WEAK2": 0.40,
-            "STRONG1": 0.80,
-            "STRONG2": 0.90,
-            "STRONG3": 0.70,
-            "MID1": 0.50,
-            "MID2": 0.55,
-        }
-        weights = allocator.calculate_target_weights(signals)
+        weights = allocator.calculate_target_weights(_RANKED_SIGNALS)
 
         # Top 5 should be: STRONG2, STRONG1, STRONG3, MID2, MID1
         equity_positions = [k for k in weights.keys() if k != "Cash"]
@@ -182,8 +228,7 @@ class TestCalculateTargetWeights:
         signals = {"AAPL": 0.8, "MSFT": 0.6, "GOOGL": 0.5, "AMZN": 0.4}
         weights = allocator.calculate_target_weights(signals)
 
-        total = sum(weights.values())
-        assert abs(total - 1.0) < 0.001
+        _assert_normalized(weights)
 
     def test_cash_buffer_maintained(self, allocator: HeuristicAllocator) -> None:
         """Test cash buffer is always maintained."""
@@ -201,26 +246,13 @@ class TestCalculateTargetWeights:
 class TestGenerateOrders:
     """Test cases for generate_orders method."""
 
-    @pytest.fixture
-    def allocator(self) -> HeuristicAllocator:
-        """Create allocator with test configuration."""
-        return HeuristicAllocator(
-            {
-                "min_signal_threshold": 0.3,
-                "max_positions": 5,
-                "cash_buffer": 0.10,
-                "max_position_size": 0.25,
-                "min_trade_value": 100.0,
-            }
-        )
-
     def test_buy_order_generation(self, allocator: HeuristicAllocator) -> None:
         """Test generating buy orders for new positions."""
         orders = allocator.generate_orders(
-            current_positions={},
-            target_weights={"AAPL": 0.25, "Cash": 0.75},
+            current_positions=_NO_POSITIONS,
+            target_weights=_TGT_AAPL25,
             total_value=100000.0,
-            prices={"AAPL": 150.0},
+            prices=_PRICES_AAPL,
         )
 
         assert len(orders) == 1
@@ -235,7 +267,7 @@ class TestGenerateOrders:
             current_positions={"AAPL": 25000.0},
             target_weights={"AAPL": 0.10, "Cash": 0.90},
             total_value=100000.0,
-            prices={"AAPL": 150.0},
+            prices=_PRICES_AAPL,
         )
 
         assert len(orders) == 1
@@ -250,7 +282,7 @@ class TestGenerateOrders:
             current_positions={"AAPL": 15000.0},
             target_weights={"Cash": 1.0},  # No AAPL in target
             total_value=100000.0,
-            prices={"AAPL": 150.0},
+            prices=_PRICES_AAPL,
         )
 
         assert len(orders) == 1
@@ -263,9 +295,9 @@ class TestGenerateOrders:
         """Test no orders when current matches target."""
         orders = allocator.generate_orders(
             current_positions={"AAPL": 25000.0},
-            target_weights={"AAPL": 0.25, "Cash": 0.75},
+            target_weights=_TGT_AAPL25,
             total_value=100000.0,
-            prices={"AAPL": 150.0},
+            prices=_PRICES_AAPL,
         )
 
         # Current matches target (25% = $25,000), no orders needed
@@ -275,9 +307,9 @@ class TestGenerateOrders:
         """Test orders below min_trade_value are skipped."""
         orders = allocator.generate_orders(
             current_positions={"AAPL": 24950.0},  # $50 below target
-            target_weights={"AAPL": 0.25, "Cash": 0.75},
+            target_weights=_TGT_AAPL25,
             total_value=100000.0,
-            prices={"AAPL": 150.0},
+            prices=_PRICES_AAPL,
         )
 
         # Difference is $50, below $100 threshold
@@ -286,10 +318,10 @@ class TestGenerateOrders:
     def test_skip_missing_prices(self, allocator: HeuristicAllocator) -> None:
         """Test symbols without prices are skipped."""
         orders = allocator.generate_orders(
-            current_positions={},
+            current_positions=_NO_POSITIONS,
             target_weights={"AAPL": 0.25, "MSFT": 0.25, "Cash": 0.50},
             total_value=100000.0,
-            prices={"AAPL": 150.0},  # No MSFT price
+            prices=_PRICES_AAPL,  # No MSFT price
         )
 
         # Only AAPL order generated
@@ -341,10 +373,10 @@ class TestGenerateOrders:
     def test_order_estimated_value(self, allocator: HeuristicAllocator) -> None:
         """Test order estimated_value is calculated correctly."""
         orders = allocator.generate_orders(
-            current_positions={},
-            target_weights={"AAPL": 0.25, "Cash": 0.75},
+            current_positions=_NO_POSITIONS,
+            target_weights=_TGT_AAPL25,
             total_value=100000.0,
-            prices={"AAPL": 150.0},
+            prices=_PRICES_AAPL,
         )
 
         order = orders[0]
@@ -354,8 +386,8 @@ class TestGenerateOrders:
     def test_skip_zero_price(self, allocator: HeuristicAllocator) -> None:
         """Test symbols with zero price are skipped."""
         orders = allocator.generate_orders(
-            current_positions={},
-            target_weights={"AAPL": 0.25, "Cash": 0.75},
+            current_positions=_NO_POSITIONS,
+            target_weights=_TGT_AAPL25,
             total_value=100000.0,
             prices={"AAPL": 0.0},
         )
@@ -366,36 +398,9 @@ class TestGenerateOrders:
 class TestAllocate:
     """Test cases for allocate method (full pipeline)."""
 
-    @pytest.fixture
-    def allocator(self) -> HeuristicAllocator:
-        """Create allocator with test configuration."""
-        return HeuristicAllocator(
-            {
-                "min_signal_threshold": 0.3,
-                "max_positions": 5,
-                "cash_buffer": 0.10,
-                "max_position_size": 0.25,
-                "min_trade_value": 100.0,
-            }
-        )
-
-    @pytest.fixture
-    def portfolio(self) -> PortfolioState:
-        """Create test portfolio state."""
-        return PortfolioState(
-            positions={"MSFT": 10000.0},
-            total_value=100000.0,
-            cash=90000.0,
-            prices={"AAPL": 150.0, "MSFT": 350.0, "GOOGL": 140.0},
-        )
-
-    def test_full_allocation_pipeline(
-        self, allocator: HeuristicAllocator, portfolio: PortfolioState
-    ) -> None:
+    def test_full_allocation_pipeline(self, allocate_result: AllocationResult) -> None:
         """Test full allocation from signals to orders."""
-        signals = {"AAPL": 0.8, "MSFT": 0.5, "GOOGL": 0.2}
-
-        result = allocator.allocate(signals, portfolio)
+        result = allocate_result
 
         # Check result structure
         assert "AAPL" in result.target_weights  # Strong signal
@@ -404,7 +409,7 @@ class TestAllocate:
         assert "Cash" in result.target_weights
 
         # Check weights sum to 1
-        assert abs(sum(result.target_weights.values()) - 1.0) < 0.001
+        _assert_normalized(result.target_weights)
 
         # Check orders exist
         assert isinstance(result.orders, list)
@@ -414,13 +419,9 @@ class TestAllocate:
         assert "cash_weight" in result.metrics
         assert "turnover" in result.metrics
 
-    def test_metrics_calculation(
-        self, allocator: HeuristicAllocator, portfolio: PortfolioState
-    ) -> None:
+    def test_metrics_calculation(self, allocate_result: AllocationResult) -> None:
         """Test metrics are calculated correctly."""
-        signals = {"AAPL": 0.8, "MSFT": 0.5}
-
-        result = allocator.allocate(signals, portfolio)
+        result = allocate_result
 
         # Position count should be 2 (AAPL + MSFT)
         assert result.metrics["position_count"] == 2.0
@@ -523,5 +524,5 @@ class TestEdgeCases:
         result = allocator.allocate(signals, portfolio)
 
         # Should still work correctly
-        assert abs(sum(result.target_weights.values()) - 1.0) < 0.001
+        _assert_normalized(result.target_weights)
         assert len(result.orders) > 0
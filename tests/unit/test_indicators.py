@@ -18,33 +18,84 @@ from src.strategy.indicators import (
 )
 
 
+@pytest.fixture(scope="session")
+def sample_data() -> pd.DataFrame:
+    """Create sample OHLCV data once per session (tests only read it)."""
+    dates = pd.date_range(start="2024-01-01", periods=100, freq="D")
+    # Same stream as np.random.seed(42), without touching global RNG state
+    rng = np.random.RandomState(42)
+
+    # Generate realistic price data
+    close = 100 + np.cumsum(rng.randn(100) * 2)
+    high = close + np.abs(rng.randn(100) * 1)
+    low = close - np.abs(rng.randn(100) * 1)
+    open_price = close + rng.randn(100) * 0.5
+    volume = rng.randint(1000000, 5000000, 100)
+
+    return pd.DataFrame(
+        {
+            "open": open_price,
+            "high": high,
+            "low": low,
+            "close": close,
+            "volume": volume,
+        },
+        index=pd.DatetimeIndex(dates, name="date"),
+    )
+
+
+# Indicator outputs computed once per class; the paired tests only read them
+@pytest.fixture(scope="class")
+def rsi_out(sample_data: pd.DataFrame) -> pd.Series:
+    """RSI(14) of the sample closes."""
+    return rsi(sample_data["close"], period=14)
+
+
+@pytest.fixture(scope="class")
+def macd_out(sample_data: pd.DataFrame) -> tuple:
+    """Default MACD (line, signal, histogram) of the sample closes."""
+    return macd(sample_data["close"])
+
+
+@pytest.fixture(scope="class")
+def bb_out(sample_data: pd.DataFrame) -> tuple:
+    """Bollinger Bands(20) (upper, middle, lower) of the sample closes."""
+    return bollinger_bands(sample_data["close"], period=20)
+
+
+@pytest.fixture(scope="class")
+def atr_out(sample_data: pd.DataFrame) -> pd.Series:
+    """ATR(14) of the sample bars."""
+    return atr(sample_data["high"], sample_data["low"], sample_data["close"], period=14)
+
+
+@pytest.fixture(scope="class")
+def stoch_out(sample_data: pd.DataFrame) -> tuple:
+    """Default Stochastic (slowk, slowd) of the sample bars."""
+    return stochastic(sample_data["high"], sample_data["low"], sample_data["close"])
+
+
+@pytest.fixture(scope="class")
+def adx_out(sample_data: pd.DataFrame) -> pd.Series:
+    """ADX(14) of the sample bars."""
+    return adx(sample_data["high"], sample_data["low"], sample_data["close"], period=14)
+
+
+@pytest.fixture(scope="class")
+def obv_out(sample_data: pd.DataFrame) -> pd.Series:
+    """OBV of the sample closes and volumes."""
+    return obv(sample_data["close"], sample_data["volume"])
+
+
+@pytest.fixture(scope="class")
+def roc_out(sample_data: pd.DataFrame) -> pd.Series:
+    """ROC(10) of the sample closes."""
+    return roc(sample_data["close"], period=10)
+
+
 class TestIndicators:
     """Test cases for TA-Lib indicator wrappers."""
 
-    @pytest.fixture
-    def sample_data(self) -> pd.DataFrame:
-        """Create sample OHLCV data for testing."""
-        dates = pd.date_range(start="2024-01-01", periods=100, freq="D")
-        np.random.seed(42)
-
-        # Generate realistic price data
-        close = 100 + np.cumsum(np.random.randn(100) * 2)
-        high = close + np.abs(np.random.randn(100) * 1)
-        low = close - np.abs(np.random.randn(100) * 1)
-        open_price = close + np.random.randn(100) * 0.5
-        volume = np.random.randint(1000000, 5000000, 100)
-
-        return pd.DataFrame(
-            {
-                "open": open_price,
-                "high": high,
-                "low": low,
-                "close": close,
-                "volume": volume,
-            },
-            index=pd.DatetimeIndex(dates, name="date"),
-        )
-
     def test_sma_basic(self, sample_data: pd.DataFrame) -> None:
         """Test SMA calculation returns correct structure."""
         result = sma(sample_data["close"], period=20)
@@ -86,26 +137,26 @@ class TestIndicators:
         non_nan_idx = ~sma_result.isna() & ~ema_result.isna()
         assert not (sma_result[non_nan_idx] == ema_result[non_nan_idx]).all()
 
-    def test_rsi_basic(self, sample_data: pd.DataFrame) -> None:
+    def test_rsi_basic(self, sample_data: pd.DataFrame, rsi_out: pd.Series) -> None:
         """Test RSI calculation returns correct structure."""
-        result = rsi(sample_data["close"], period=14)
+        result = rsi_out
 
         assert isinstance(result, pd.Series)
         assert len(result) == len(sample_data)
         assert result.name == "rsi_14"
 
-    def test_rsi_range(self, sample_data: pd.DataFrame) -> None:
+    def test_rsi_range(self, rsi_out: pd.Series) -> None:
         """Test RSI values are in valid range [0, 100]."""
-        result = rsi(sample_data["close"], period=14)
+        result = rsi_out
 
         # RSI should be between 0 and 100
         valid_values = result.dropna()
         assert valid_values.min() >= 0
         assert valid_values.max() <= 100
 
-    def test_macd_basic(self, sample_data: pd.DataFrame) -> None:
+    def test_macd_basic(self, sample_data: pd.DataFrame, macd_out: tuple) -> None:
         """Test MACD calculation returns three series."""
-        macd_line, signal_line, histogram = macd(sample_data["close"])
+        macd_line, signal_line, histogram = macd_out
 
         assert isinstance(macd_line, pd.Series)
         assert isinstance(signal_line, pd.Series)
@@ -119,9 +170,9 @@ class TestIndicators:
         assert signal_line.name == "macd_signal"
         assert histogram.name == "macd_histogram"
 
-    def test_macd_histogram_relationship(self, sample_data: pd.DataFrame) -> None:
+    def test_macd_histogram_relationship(self, macd_out: tuple) -> None:
         """Test MACD histogram is difference between MACD and signal."""
-        macd_line, signal_line, histogram = macd(sample_data["close"])
+        macd_line, signal_line, histogram = macd_out
 
         # Histogram should be MACD - Signal (approximately, accounting for NaN)
         valid_idx = ~macd_line.isna() & ~signal_line.isna()
@@ -131,9 +182,11 @@ class TestIndicators:
             histogram[valid_idx].values, expected_histogram.values, decimal=10
         )
 
-    def test_bollinger_bands_basic(self, sample_data: pd.DataFrame) -> None:
+    def test_bollinger_bands_basic(
+        self, sample_data: pd.DataFrame, bb_out: tuple
+    ) -> None:
         """Test Bollinger Bands calculation returns three series."""
-        upper, middle, lower = bollinger_bands(sample_data["close"], period=20)
+        upper, middle, lower = bb_out
 
         assert isinstance(upper, pd.Series)
         assert isinstance(middle, pd.Series)
@@ -144,9 +197,9 @@ class TestIndicators:
         assert middle.name == "bb_middle_20"
         assert lower.name == "bb_lower_20"
 
-    def test_bollinger_bands_relationship(self, sample_data: pd.DataFrame) -> None:
+    def test_bollinger_bands_relationship(self, bb_out: tuple) -> None:
         """Test Bollinger Bands maintain upper > middle > lower."""
-        upper, middle, lower = bollinger_bands(sample_data["close"], period=20)
+        upper, middle, lower = bb_out
 
         valid_idx = ~upper.isna() & ~middle.isna() & ~lower.isna()
 
@@ -154,30 +207,26 @@ class TestIndicators:
         assert (upper[valid_idx] >= middle[valid_idx]).all()
         assert (middle[valid_idx] >= lower[valid_idx]).all()
 
-    def test_atr_basic(self, sample_data: pd.DataFrame) -> None:
+    def test_atr_basic(self, sample_data: pd.DataFrame, atr_out: pd.Series) -> None:
         """Test ATR calculation returns correct structure."""
-        result = atr(
-            sample_data["high"], sample_data["low"], sample_data["close"], period=14
-        )
+        result = atr_out
 
         assert isinstance(result, pd.Series)
         assert len(result) == len(sample_data)
         assert result.name == "atr_14"
 
-    def test_atr_positive_values(self, sample_data: pd.DataFrame) -> None:
+    def test_atr_positive_values(self, atr_out: pd.Series) -> None:
         """Test ATR values are positive (volatility measure)."""
-        result = atr(
-            sample_data["high"], sample_data["low"], sample_data["close"], period=14
-        )
+        result = atr_out
 
         valid_values = result.dropna()
         assert (valid_values >= 0).all()
 
-    def test_stochastic_basic(self, sample_data: pd.DataFrame) -> None:
+    def test_stochastic_basic(
+        self, sample_data: pd.DataFrame, stoch_out: tuple
+    ) -> None:
         """Test Stochastic oscillator returns two series."""
-        slowk, slowd = stochastic(
-            sample_data["high"], sample_data["low"], sample_data["close"]
-        )
+        slowk, slowd = stoch_out
 
         assert isinstance(slowk, pd.Series)
         assert isinstance(slowd, pd.Series)
@@ -186,11 +235,9 @@ class TestIndicators:
         assert slowk.name == "stoch_k"
         assert slowd.name == "stoch_d"
 
-    def test_stochastic_range(self, sample_data: pd.DataFrame) -> None:
+    def test_stochastic_range(self, stoch_out: tuple) -> None:
         """Test Stochastic values are in range [0, 100]."""
-        slowk, slowd = stochastic(
-            sample_data["high"], sample_data["low"], sample_data["close"]
-        )
+        slowk, slowd = stoch_out
 
         valid_k = slowk.dropna()
         valid_d = slowd.dropna()
@@ -200,37 +247,33 @@ class TestIndicators:
         assert valid_d.min() >= 0
         assert valid_d.max() <= 100
 
-    def test_adx_basic(self, sample_data: pd.DataFrame) -> None:
+    def test_adx_basic(self, sample_data: pd.DataFrame, adx_out: pd.Series) -> None:
         """Test ADX calculation returns correct structure."""
-        result = adx(
-            sample_data["high"], sample_data["low"], sample_data["close"], period=14
-        )
+        result = adx_out
 
         assert isinstance(result, pd.Series)
         assert len(result) == len(sample_data)
         assert result.name == "adx_14"
 
-    def test_adx_range(self, sample_data: pd.DataFrame) -> None:
+    def test_adx_range(self, adx_out: pd.Series) -> None:
         """Test ADX values are in valid range [0, 100]."""
-        result = adx(
-            sample_data["high"], sample_data["low"], sample_data["close"], period=14
-        )
+        result = adx_out
 
         valid_values = result.dropna()
         assert valid_values.min() >= 0
         assert valid_values.max() <= 100
 
-    def test_obv_basic(self, sample_data: pd.DataFrame) -> None:
+    def test_obv_basic(self, sample_data: pd.DataFrame, obv_out: pd.Series) -> None:
         """Test OBV calculation returns correct structure."""
-        result = obv(sample_data["close"], sample_data["volume"])
+        result = obv_out
 
         assert isinstance(result, pd.Series)
         assert len(result) == len(sample_data)
         assert result.name == "obv"
 
-    def test_obv_cumulative(self, sample_data: pd.DataFrame) -> None:
+    def test_obv_cumulative(self, obv_out: pd.Series) -> None:
         """Test OBV is cumulative (changes based on price direction)."""
-        result = obv(sample_data["close"], sample_data["volume"])
+        result = obv_out
 
         # OBV should have no NaN values (starts from first value)
         assert not result.isna().any()
@@ -239,17 +282,17 @@ class TestIndicators:
         obv_changes = result.diff().dropna()
         assert len(obv_changes) > 0
 
-    def test_roc_basic(self, sample_data: pd.DataFrame) -> None:
+    def test_roc_basic(self, sample_data: pd.DataFrame, roc_out: pd.Series) -> None:
         """Test ROC calculation returns correct structure."""
-        result = roc(sample_data["close"], period=10)
+        result = roc_out
 
         assert isinstance(result, pd.Series)
         assert len(result) == len(sample_data)
         assert result.name == "roc_10"
 
-    def test_roc_percentage(self, sample_data: pd.DataFrame) -> None:
+    def test_roc_percentage(self, roc_out: pd.Series) -> None:
         """Test ROC represents percentage change."""
-        result = roc(sample_data["close"], period=10)
+        result = roc_out
 
         # ROC should be NaN for first 10 values
         assert result.iloc[:10].isna().all()
@@ -273,14 +316,13 @@ class TestIndicators:
         pd.testing.assert_index_equal(ema_result.index, sample_data.index)
         pd.testing.assert_index_equal(rsi_result.index, sample_data.index)
 
+    @pytest.mark.parametrize("period", [5, 10, 20, 50])
     def test_indicators_handle_different_periods(
-        self, sample_data: pd.DataFrame
+        self, sample_data: pd.DataFrame, period: int
     ) -> None:
         """Test indicators can handle different period parameters."""
         close = sample_data["close"]
 
-        # Test various periods
-        for period in [5, 10, 20, 50]:
-            sma_result = sma(close, period=period)
-            assert isinstance(sma_result, pd.Series)
-            assert len(sma_result) == len(close)
+        sma_result = sma(close, period=period)
+        assert isinstance(sma_result, pd.Series)
+        assert len(sma_result) == len(close)
@@ -6,7 +6,6 @@ Tests trading event logging, log rotation, and structured output.
 import json
 import logging
 from pathlib import Path
-from tempfile import TemporaryDirectory
 
 import pytest
 
@@ -17,6 +16,19 @@ from src.utils.logging_enhanced import (
 )
 
 
+def _close_handlers(trading_logger: TradingLogger) -> None:
+    """Close the rotating file handlers a TradingLogger opened."""
+    for log in (
+        trading_logger.order_logger,
+        trading_logger.risk_logger,
+        trading_logger.signal_logger,
+        trading_logger.system_logger,
+        trading_logger.error_logger,
+    ):
+        for handler in log.handlers:
+            handler.close()
+
+
 class TestTradingEventType:
     """Tests for TradingEventType enum."""
 
@@ -42,216 +54,213 @@ class TestTradingEventType:
 class TestTradingLogger:
     """Tests for TradingLogger."""
 
-    def test_initialization(self):
+    @pytest.fixture
+    def trading_logger(self, tmp_path: Path):
+        """Create a file-only TradingLogger in tmp_path, closing its files after the test."""
+        logger = TradingLogger(log_dir=tmp_path, enable_console=False)
+        yield logger, tmp_path
+        _close_handlers(logger)
+
+    def test_initialization(self, tmp_path: Path):
         """Test TradingLogger initialization."""
-        with TemporaryDirectory() as tmpdir:
-            logger = TradingLogger(log_dir=tmpdir)
+        logger = TradingLogger(log_dir=tmp_path)
 
-            assert logger.log_dir == Path(tmpdir)
-            assert logger.max_bytes == 10 * 1024 * 1024
-            assert logger.backup_count == 30
+        assert logger.log_dir == tmp_path
+        assert logger.max_bytes == 10 * 1024 * 1024
+        assert logger.backup_count == 30
 
-            # Check log files are created
-            assert (Path(tmpdir) / "orders.log").exists()
-            assert (Path(tmpdir) / "risk.log").exists()
-            assert (Path(tmpdir) / "signals.log").exists()
-            assert (Path(tmpdir) / "system.log").exists()
-            assert (Path(tmpdir) / "errors.log").exists()
+        # Check log files are created
+        assert (tmp_path / "orders.log").exists()
+        assert (tmp_path / "risk.log").exists()
+        assert (tmp_path / "signals.log").exists()
+        assert (tmp_path / "system.log").exists()
+        assert (tmp_path / "errors.log").exists()
+        _close_handlers(logger)
 
-    def test_log_order_event(self):
+    def test_log_order_event(self, trading_logger):
         """Test logging order events."""
-        with TemporaryDirectory() as tmpdir:
-            logger = TradingLogger(log_dir=tmpdir, enable_console=False)
-
-            logger.log_order_event(
-                event_type=TradingEventType.ORDER_FILLED,
-                symbol="AAPL",
-                shares=100,
-                price=150.25,
-                order_id="order_123",
-            )
-
-            # Read log file
-            log_file = Path(tmpdir) / "orders.log"
-            with open(log_file) as f:
-                log_line = f.read().strip()
-
-            # Parse JSON (outer formatter adds wrapper)
-            assert "order_filled" in log_line
-            assert "AAPL" in log_line
-            assert "100" in log_line
-
-    def test_log_risk_event(self):
+        logger, log_dir = trading_logger
+
+        logger.log_order_event(
+            event_type=TradingEventType.ORDER_FILLED,
+            symbol="AAPL",
+            shares=100,
+            price=150.25,
+            order_id="order_123",
+        )
+
+        # Read log file
+        log_file = log_dir / "orders.log"
+        with open(log_file) as f:
+            log_line = f.read().strip()
+
+        # Parse JSON (outer formatter adds wrapper)
+        assert "order_filled" in log_line
+        assert "AAPL" in log_line
+        assert "100" in log_line
+
+    def test_log_risk_event(self, trading_logger):
         """Test logging risk events."""
-        with TemporaryDirectory() as tmpdir:
-            logger = TradingLogger(log_dir=tmpdir, enable_console=False)
-
-            logger.log_risk_event(
-                event_type=TradingEventType.STOP_LOSS_TRIGGERED,
-                reason="Price dropped below -3% threshold",
-                symbol="MSFT",
-                current_price=285.50,
-            )
-
-            # Read log file
-            log_file = Path(tmpdir) / "risk.log"
-            with open(log_file) as f:
-                log_line = f.read().strip()
-
-            assert "stop_loss_triggered" in log_line
-            assert "MSFT" in log_line
-            assert "Price dropped" in log_line
-
-    def test_log_signal_event(self):
+        logger, log_dir = trading_logger
+
+        logger.log_risk_event(
+            event_type=TradingEventType.STOP_LOSS_TRIGGERED,
+            reason="Price dropped below -3% threshold",
+            symbol="MSFT",
+            current_price=285.50,
+        )
+
+        # Read log file
+        log_file = log_dir / "risk.log"
+        with open(log_file) as f:
+            log_line = f.read().strip()
+
+        assert "stop_loss_triggered" in log_line
+        assert "MSFT" in log_line
+        assert "Price dropped" in log_line
+
+    def test_log_signal_event(self, trading_logger):
         """Test logging signal events."""
-        with TemporaryDirectory() as tmpdir:
-            logger = TradingLogger(log_dir=tmpdir, enable_console=False)
-
-            logger.log_signal_event(
-                event_type=TradingEventType.SIGNAL_GENERATED,
-                symbol="GOOGL",
-                signal_value=0.75,
-                strategy="MA_Crossover",
-            )
-
-            # Read log file
-            log_file = Path(tmpdir) / "signals.log"
-            with open(log_file) as f:
-                log_line = f.read().strip()
-
-            assert "signal_generated" in log_line
-            assert "GOOGL" in log_line
-            assert "0.75" in log_line
-
-    def test_log_system_event(self):
+        logger, log_dir = trading_logger
+
+        logger.log_signal_event(
+            event_type=TradingEventType.SIGNAL_GENERATED,
+            symbol="GOOGL",
+            signal_value=0.75,
+            strategy="MA_Crossover",
+        )
+
+        # Read log file
+        log_file = log_dir / "signals.log"
+        with open(log_file) as f:
+            log_line = f.read().strip()
+
+        assert "signal_generated" in log_line
+        assert "GOOGL" in log_line
+        assert "0.75" in log_line
+
+    def test_log_system_event(self, trading_logger):
         """Test logging system events."""
-        with TemporaryDirectory() as tmpdir:
-            logger = TradingLogger(log_dir=tmpdir, enable_console=False)
+        logger, log_dir = trading_logger
 
-            logger.log_system_event(
-                event_type=TradingEventType.TRADING_SESSION_STARTED,
-                message="Paper trading session started",
-                mode="paper",
-            )
+        logger.log_system_event(
+            event_type=TradingEventType.TRADING_SESSION_STARTED,
+            message="Paper trading session started",
+            mode="paper",
+        )
 
-            # Read log file
-            log_file = Path(tmpdir) / "system.log"
-            with open(log_file) as f:
-                log_line = f.read().strip()
+        # Read log file
+        log_file = log_dir / "system.log"
+        with open(log_file) as f:
+            log_line = f.read().strip()
 
-            assert "trading_session_started" in log_line
-            assert "Paper trading" in log_line
+        assert "trading_session_started" in log_line
+        assert "Paper trading" in log_line
 
-    def test_log_error(self):
+    def test_log_error(self, trading_logger):
         """Test logging error events."""
-        with TemporaryDirectory() as tmpdir:
-            logger = TradingLogger(log_dir=tmpdir, enable_console=False)
+        logger, log_dir = trading_logger
 
-            logger.log_error(
-                event_type=TradingEventType.EXECUTION_ERROR,
-                error="Failed to submit order: Connection timeout",
-                symbol="AAPL",
-            )
+        logger.log_error(
+            event_type=TradingEventType.EXECUTION_ERROR,
+            error="Failed to submit order: Connection timeout",
+            symbol="AAPL",
+        )
 
-            # Read log file
-            log_file = Path(tmpdir) / "errors.log"
-            with open(log_file) as f:
-                log_line = f.read().strip()
+        # Read log file
+        log_file = log_dir / "errors.log"
+        with open(log_file) as f:
+            log_line = f.read().strip()
 
-            assert "execution_error" in log_line
-            assert "Connection timeout" in log_line
+        assert "execution_error" in log_line
+        assert "Connection timeout" in log_line
 
-    def test_log_performance(self):
+    def test_log_performance(self, trading_logger):
         """Test logging performance metrics."""
-        with TemporaryDirectory() as tmpdir:
-            logger = TradingLogger(log_dir=tmpdir, enable_console=False)
-
-            logger.log_performance(
-                portfolio_value=105000.0,
-                daily_pnl=2000.0,
-                daily_return=0.02,
-                sharpe_ratio=1.5,
-            )
-
-            # Read log file
-            log_file = Path(tmpdir) / "system.log"
-            with open(log_file) as f:
-                log_line = f.read().strip()
-
-            assert "daily_performance_recorded" in log_line
-            assert "105000" in log_line
-            assert "2000" in log_line
-
-    def test_json_structure(self):
+        logger, log_dir = trading_logger
+
+        logger.log_performance(
+            portfolio_value=105000.0,
+            daily_pnl=2000.0,
+            daily_return=0.02,
+            sharpe_ratio=1.5,
+        )
+
+        # Read log file
+        log_file = log_dir / "system.log"
+        with open(log_file) as f:
+            log_line = f.read().strip()
+
+        assert "daily_performance_recorded" in log_line
+        assert "105000" in log_line
+        assert "2000" in log_line
+
+    def test_json_structure(self, trading_logger):
         """Test that logged events have proper JSON structure."""
-        with TemporaryDirectory() as tmpdir:
-            logger = TradingLogger(log_dir=tmpdir, enable_console=False)
-
-            logger.log_order_event(
-                event_type=TradingEventType.ORDER_SUBMITTED,
-                symbol="AAPL",
-                shares=100,
-                price=150.0,
-            )
-
-            # Read and parse log
-            log_file = Path(tmpdir) / "orders.log"
-            with open(log_file, encoding="utf-8") as f:
-                log_line = f.read().strip()
-
-            # The log line is a JSON object with timestamp, level, and message
-            log_json = json.loads(log_line)
-
-            assert "timestamp" in log_json
-            assert "level" in log_json
-            assert "message" in log_json
-
-            # Message field contains another JSON string that needs parsing
-            # The formatter inserts the JSON without quotes, making it an object
-            if isinstance(log_json["message"], str):
-                event_json = json.loads(log_json["message"])
-            else:
-                # Message is already parsed as an object
-                event_json = log_json["message"]
-
-            assert event_json["event_type"] == "order_submitted"
-            assert event_json["symbol"] == "AAPL"
-            assert event_json["shares"] == 100
-            assert event_json["price"] == 150.0
-            assert "timestamp" in event_json
-
-    def test_disable_console_logging(self):
+        logger, log_dir = trading_logger
+
+        logger.log_order_event(
+            event_type=TradingEventType.ORDER_SUBMITTED,
+            symbol="AAPL",
+            shares=100,
+            price=150.0,
+        )
+
+        # Read and parse log
+        log_file = log_dir / "orders.log"
+        with open(log_file, encoding="utf-8") as f:
+            log_line = f.read().strip()
+
+        # The log line is a JSON object with timestamp, level, and message
+        log_json = json.loads(log_line)
+
+        assert "timestamp" in log_json
+        assert "level" in log_json
+        assert "message" in log_json
+
+        # Message field contains another JSON string that needs parsing
+        # The formatter inserts the JSON without quotes, making it an object
+        if isinstance(log_json["message"], str):
+            event_json = json.loads(log_json["message"])
+        else:
+            # Message is already parsed as an object
+            event_json = log_json["message"]
+
+        assert event_json["event_type"] == "order_submitted"
+        assert event_json["symbol"] == "AAPL"
+        assert event_json["shares"] == 100
+        assert event_json["price"] == 150.0
+        assert "timestamp" in event_json
+
+    def test_disable_console_logging(self, trading_logger):
         """Test disabling console output."""
-        with TemporaryDirectory() as tmpdir:
-            logger = TradingLogger(log_dir=tmpdir, enable_console=False)
+        logger, log_dir = trading_logger
 
-            # Check that loggers don't have StreamHandler
-            for log in [logger.order_logger, logger.risk_logger]:
-                stream_handlers = [
-                    h for h in log.handlers
-                    if isinstance(h, logging.StreamHandler)
-                       and not isinstance(h, logging.handlers.RotatingFileHandler)
-                ]
-                assert len(stream_handlers) == 0
+        # Check that loggers don't have StreamHandler
+        for log in [logger.order_logger, logger.risk_logger]:
+            stream_handlers = [
+                h for h in log.handlers
+                if isinstance(h, logging.StreamHandler)
+                   and not isinstance(h, logging.handlers.RotatingFileHandler)
+            ]
+            assert len(stream_handlers) == 0
 
 
 class TestGlobalLogger:
     """Tests for global logger instance."""
 
-    def test_get_trading_logger(self):
+    def test_get_trading_logger(self, tmp_path: Path):
         """Test getting global trading logger."""
-        with TemporaryDirectory() as tmpdir:
-            logger = get_trading_logger(log_dir=tmpdir)
+        logger = get_trading_logger(log_dir=tmp_path)
 
-            assert isinstance(logger, TradingLogger)
+        assert isinstance(logger, TradingLogger)
 
-    def test_get_trading_logger_singleton(self):
+    def test_get_trading_logger_singleton(self, tmp_path: Path):
         """Test that get_trading_logger returns same instance."""
         # Note: This test assumes the global logger persists between calls
         # In a real test suite, you'd want to reset global state between tests
-        with TemporaryDirectory() as tmpdir:
-            logger1 = get_trading_logger(log_dir=tmpdir)
-            logger2 = get_trading_logger(log_dir=tmpdir)
+        logger1 = get_trading_logger(log_dir=tmp_path)
+        logger2 = get_trading_logger(log_dir=tmp_path)
 
-            # Should be the same instance (singleton pattern)
-            assert logger1 is logger2
+        # Should be the same instance (singleton pattern)
+        assert logger1 is logger2
@@ -6,6 +6,7 @@ risk metrics and detecting threshold breaches.
 
 from datetime import datetime, timedelta
 
+import numpy as np
 import pytest
 
 from src.risk.monitors import (
@@ -130,6 +131,22 @@ class TestPositionMonitor:
         assert monitor.positions["AAPL"].entry_price == 150.0
         assert monitor.positions["AAPL"].shares == 100
 
+    def test_add_positions(self):
+        """Test adding several positions in one call."""
+        monitor = PositionMonitor()
+        monitor.add_positions(["AAPL", "MSFT"], [150.0, 300.0], [100, 50])
+
+        assert monitor.positions["AAPL"].entry_price == 150.0
+        assert monitor.positions["MSFT"].shares == 50
+        assert monitor.positions["AAPL"].entry_time == monitor.positions["MSFT"].entry_time
+
+    def test_add_positions_length_mismatch(self):
+        """Test add_positions rejects misaligned inputs."""
+        monitor = PositionMonitor()
+
+        with pytest.raises(ValueError, match="equal length"):
+            monitor.add_positions(["AAPL", "MSFT"], [150.0], [100, 50])
+
     def test_remove_position(self):
         """Test removing a position."""
         monitor = PositionMonitor()
@@ -221,6 +238,18 @@ class TestPositionMonitor:
         symbols = {signal.symbol for signal in exit_signals}
         assert symbols == {"AAPL", "MSFT"}
 
+    def test_check_all_positions_trailing_stop(self):
+        """Test the batched scan also flags trailing-stop breaches."""
+        monitor = PositionMonitor(trailing_stop_pct=0.05, take_profit_pct=0.50)
+        monitor.add_positions(["AAPL", "MSFT"], [100.0, 100.0], [100, 100])
+        monitor.update_prices({"AAPL": 120.0, "MSFT": 101.0})
+        monitor.update_prices({"AAPL": 113.0})  # 5.83% off the 120 peak
+
+        exit_signals = monitor.check_all_positions()
+
+        assert [signal.symbol for signal in exit_signals] == ["AAPL"]
+        assert exit_signals[0].trigger_type == "trailing_stop"
+
     def test_get_position_risks(self):
         """Test getting position risk metrics."""
         monitor = PositionMonitor()
@@ -371,6 +400,31 @@ class TestPortfolioMonitor:
         assert not triggered
         assert not monitor.circuit_breaker_triggered
 
+    def test_replay_values_matches_step_by_step(self):
+        """Test replay_values agrees with update_value + check_circuit_breaker."""
+        values = 100000.0 * np.cumprod(1 + np.random.default_rng(7).normal(0, 0.01, 200))
+        replayed = PortfolioMonitor(initial_value=100000.0)
+        replay = replayed.replay_values(values)
+
+        monitor = PortfolioMonitor(initial_value=100000.0)
+        expected = []
+        for value in values:
+            monitor.update_value(value)
+            expected.append(monitor.check_circuit_breaker())
+
+        assert replay.tolist() == expected
+        assert replay.any()
+        # Replay leaves the monitor untouched
+        assert replayed.state.portfolio_value == 100000.0
+        assert replayed.state.peak_value == 100000.0
+        assert not replayed.circuit_breaker_triggered
+
+    def test_replay_values_empty(self):
+        """Test replay_values on an empty series."""
+        monitor = PortfolioMonitor(initial_value=100000.0)
+
+        assert monitor.replay_values([]).size == 0
+
     def test_get_metrics(self):
         """Test getting portfolio metrics."""
         monitor = PortfolioMonitor(initial_value=100000.0)